@@ -0,0 +1,21 @@
+class AdaptiveDelay:
+    """Delay between loop passes that adapts to load instead of staying fixed
+
+    Loops drive it with their own busy/quiet signal: backoff() grows the
+    delay after a quiet pass, reset() snaps it back once there is work.
+    """
+
+    def __init__(self, initial: float = 1.0, maximum: float = 5.0):
+        self.initial = initial
+        self.maximum = maximum
+        self.delay = initial
+
+    def backoff(self) -> float:
+        """Grow the delay after a quiet pass"""
+        self.delay = min(self.maximum, self.delay * 1.5)
+        return self.delay
+
+    def reset(self) -> float:
+        """Return to the initial delay"""
+        self.delay = self.initial
+        return self.delay
@@ -3,9 +3,10 @@ from typing import Dict, List, Any
 import asyncio
 import logging
 from datetime import datetime
-import json
+from divine_logging import attach_queued_file_handler
+from ttl_cache import async_ttl_cache
 
-@dataclass
+@dataclass(slots=True)
 class BlockchainNetwork:
     name: str
     chain_id: int
@@ -23,11 +24,7 @@ class BlockchainMaster:
         self.logger = logging.getLogger("BlockchainMaster")
         self.logger.setLevel(logging.INFO)
         
-        handler = logging.FileHandler("logs/blockchain_master.log")
-        handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        )
-        self.logger.addHandler(handler)
+        attach_queued_file_handler(self.logger, "logs/blockchain_master.log")
         
     def initialize_networks(self):
         """Initialize supported blockchain networks"""
@@ -104,6 +101,7 @@ class BlockchainMaster:
             }
         }
         
+    @async_ttl_cache(ttl=0.5)
     async def health_check(self) -> Dict[str, Any]:
         """Check health of blockchain master"""
         active_networks = sum(1 for n in self.networks.values() if n.active)
@@ -2,9 +2,11 @@ import asyncio
 from typing import Dict, List, Set, Any
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
+import heapq
 import json
+import logging
 import os
-from web3 import Web3
 from content_generation import ContentCreator
 from platform_automation import PlatformManager
 from payment_processing import CryptoProcessor
@@ -12,7 +14,9 @@ from identity_verification import VerificationSystem
 from banking_automation import BankingManager
 from content_optimization import RevenueOptimizer
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
 class ContentCreatorProfile:
     platform_name: str
     username: str
@@ -25,6 +29,34 @@ class ContentCreatorProfile:
     crypto_wallets: Dict[str, str]
 
 class ContentMonetizationEmpire:
+    # Pipeline step names, bound to methods once per instance on first use
+    _VERIFY_STEPS = (
+        '_verify_identity', '_verify_face_match', '_verify_documents',
+        '_verify_banking', '_verify_address'
+    )
+    _REVENUE_COLLECTION_STEPS = (
+        '_setup_platform_collection', '_setup_tips_collection', '_setup_crypto_conversion',
+        '_setup_payment_processing', '_setup_revenue_tracking'
+    )
+    _CONTENT_STRATEGY_STEPS = (
+        '_optimize_content_calendar', '_optimize_price_points', '_optimize_engagement',
+        '_optimize_upselling', '_optimize_retention'
+    )
+    _CRYPTO_CONVERSION_STEPS = (
+        '_collect_platform_revenue', '_perform_crypto_conversion', '_transfer_to_secure_wallet',
+        '_optimize_conversion_rates', '_track_crypto_transfers'
+    )
+
+    # Per-profile upkeep tasks and their cadence in seconds
+    _PROFILE_TASK_INTERVALS = {
+        '_update_content': 1.0,
+        '_engage_fans': 1.0,
+        '_process_requests': 1.0,
+        '_handle_messages': 1.0,
+        '_track_metrics': 1.0
+    }
+    _MAX_PROFILE_BACKOFF = 300.0
+
     def __init__(self):
         self.creator_profiles = {}
         self.platform_accounts = {}
@@ -128,50 +160,41 @@ class ContentMonetizationEmpire:
         
         return profile
 
+    @cached_property
+    def _verify_methods(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._VERIFY_STEPS)
+
+    @cached_property
+    def _revenue_collection_methods(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._REVENUE_COLLECTION_STEPS)
+
+    @cached_property
+    def _content_strategy_methods(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._CONTENT_STRATEGY_STEPS)
+
+    @cached_property
+    def _crypto_conversion_methods(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._CRYPTO_CONVERSION_STEPS)
+
     async def _verify_profile(self, profile: ContentCreatorProfile):
         """Handle platform verification process"""
-        verification_steps = {
-            'id_verification': self._verify_identity,
-            'face_verification': self._verify_face_match,
-            'document_verification': self._verify_documents,
-            'bank_verification': self._verify_banking,
-            'address_verification': self._verify_address
-        }
-        
-        for step_name, verify_func in verification_steps.items():
+        for verify_func in self._verify_methods:
             await verify_func(profile)
 
     async def setup_revenue_collection(self, profile: ContentCreatorProfile):
         """Setup automated revenue collection systems"""
-        systems = {
-            'platform_earnings': self._setup_platform_collection,
-            'tips_collection': self._setup_tips_collection,
-            'crypto_conversion': self._setup_crypto_conversion,
-            'payment_processing': self._setup_payment_processing,
-            'revenue_tracking': self._setup_revenue_tracking
-        }
-        
-        for system_name, setup_func in systems.items():
+        for setup_func in self._revenue_collection_methods:
             await setup_func(profile)
 
     async def optimize_content_strategy(self, profile: ContentCreatorProfile):
         """Optimize content strategy for maximum revenue"""
-        strategies = {
-            'content_planning': self._optimize_content_calendar,
-            'pricing_strategy': self._optimize_price_points,
-            'engagement_tactics': self._optimize_engagement,
-            'upselling_methods': self._optimize_upselling,
-            'retention_strategy': self._optimize_retention
-        }
-        
-        for strategy_name, optimize_func in strategies.items():
+        for optimize_func in self._content_strategy_methods:
             await optimize_func(profile)
 
     async def run_monetization_empire(self):
         """Run the content monetization empire"""
         while True:
             await asyncio.gather(
-                self._manage_profiles(),
                 self._create_content(),
                 self._engage_subscribers(),
                 self._process_payments(),
@@ -183,33 +206,76 @@ class ContentMonetizationEmpire:
             await asyncio.sleep(1)
 
     async def _manage_profiles(self):
-        """Manage all creator profiles"""
-        for profile in self.creator_profiles.values():
-            await asyncio.gather(
-                self._update_content(profile),
-                self._engage_fans(profile),
-                self._process_requests(profile),
-                self._handle_messages(profile),
-                self._track_metrics(profile)
-            )
+        """Manage all creator profiles
+        
+        Each (profile, task) pair sits in a deadline heap and only runs when
+        it falls due, so work scales with task cadence rather than with the
+        number of profiles. A failing task backs off exponentially for that
+        profile alone.
+        """
+        loop = asyncio.get_running_loop()
+        schedule = []  # heap of (next_due, profile_id, task_name)
+        backoff: Dict[tuple, float] = {}
+        scheduled = set()
+        
+        while True:
+            now = loop.time()
+            for profile_id in self.creator_profiles.keys() - scheduled:
+                scheduled.add(profile_id)
+                for task_name in self._PROFILE_TASK_INTERVALS:
+                    heapq.heappush(schedule, (now, profile_id, task_name))
+            
+            due = []
+            while schedule and schedule[0][0] <= now:
+                due.append(heapq.heappop(schedule))
+            
+            if due:
+                async with asyncio.TaskGroup() as tg:
+                    runs = []
+                    for _, profile_id, task_name in due:
+                        profile = self.creator_profiles.get(profile_id)
+                        if profile is None:
+                            scheduled.discard(profile_id)
+                            continue
+                        task = tg.create_task(self._run_profile_task(task_name, profile))
+                        runs.append((profile_id, task_name, task))
+                
+                finished = loop.time()
+                for profile_id, task_name, task in runs:
+                    key = (profile_id, task_name)
+                    interval = self._PROFILE_TASK_INTERVALS[task_name]
+                    if task.result():
+                        backoff.pop(key, None)
+                    else:
+                        interval = backoff[key] = min(
+                            backoff.get(key, interval) * 2, self._MAX_PROFILE_BACKOFF
+                        )
+                    heapq.heappush(schedule, (finished + interval, profile_id, task_name))
+            
+            # Wake for the earliest deadline, but at least once a second to
+            # pick up newly added profiles
+            delay = schedule[0][0] - loop.time() if schedule else 1.0
+            await asyncio.sleep(min(max(delay, 0), 1.0))
+
+    async def _run_profile_task(self, task_name: str, profile: ContentCreatorProfile) -> bool:
+        """Run one upkeep task for a profile, reporting success"""
+        try:
+            await getattr(self, task_name)(profile)
+            return True
+        except Exception:
+            logger.exception("Error running %s for %s", task_name, profile.username)
+            return False
 
     async def _convert_to_crypto(self):
         """Convert all revenue to crypto"""
-        conversion_steps = {
-            'collect_revenue': self._collect_platform_revenue,
-            'convert_to_crypto': self._perform_crypto_conversion,
-            'transfer_to_wallet': self._transfer_to_secure_wallet,
-            'optimize_rates': self._optimize_conversion_rates,
-            'track_transfers': self._track_crypto_transfers
-        }
-        
-        for step_name, step_func in conversion_steps.items():
+        for step_func in self._crypto_conversion_methods:
             await step_func()
 
     async def run_forever(self):
         """Run the content monetization empire forever"""
         await asyncio.gather(
             self.run_monetization_empire(),
+            self._manage_profiles(),
             self._monitor_platform_trends(),
             self._implement_innovations(),
             self._maintain_dominance(),
@@ -3,9 +3,10 @@ from typing import Dict, List, Any
 import asyncio
 import logging
 from datetime import datetime
-import json
+from divine_logging import attach_queued_file_handler
+from ttl_cache import async_ttl_cache
 
-@dataclass
+@dataclass(slots=True)
 class CryptoDomain:
     name: str
     strategies: List[str]
@@ -17,17 +18,14 @@ class CryptoDominion:
     def __init__(self):
         self._setup_logging()
         self.domains = {}
+        self._wakeups: Dict[str, asyncio.Event] = {}
         self.initialize_domains()
         
     def _setup_logging(self):
         self.logger = logging.getLogger("CryptoDominion")
         self.logger.setLevel(logging.INFO)
         
-        handler = logging.FileHandler("logs/crypto_dominion.log")
-        handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        )
-        self.logger.addHandler(handler)
+        attach_queued_file_handler(self.logger, "logs/crypto_dominion.log")
         
     def initialize_domains(self):
         """Initialize all crypto domains"""
@@ -83,19 +81,52 @@ class CryptoDominion:
         self.logger.info("Starting Crypto Dominion")
         await self.manage_domains()
         
-    async def manage_domains(self):
-        """Manage all crypto domains"""
+    def notify(self, domain_key: str = None):
+        """Wake one domain loop, or all of them, to execute strategies now"""
+        if domain_key is None:
+            for wakeup in self._wakeups.values():
+                wakeup.set()
+        else:
+            self._wakeups[domain_key].set()
+        
+    async def _domain_loop(self, domain_key: str):
+        """Execute a domain's strategies each time it is woken"""
+        wakeup = self._wakeups[domain_key]
         while True:
-            try:
-                await asyncio.gather(
-                    self.manage_defi(),
-                    self.manage_trading(),
-                    self.manage_nft(),
-                    self.manage_metaverse()
+            await wakeup.wait()
+            wakeup.clear()
+            await self._execute_domain_strategies(self.domains[domain_key])
+            
+    async def manage_domains(self):
+        """Manage all crypto domains
+        
+        Each domain runs as one persistent task woken through its event; this
+        supervisor wakes them every second and restarts any that crash.
+        """
+        self._wakeups = {key: asyncio.Event() for key in self.domains}
+        tasks = {
+            asyncio.create_task(self._domain_loop(key)): key
+            for key in self.domains
+        }
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        try:
+            while True:
+                if loop.time() >= next_tick:
+                    self.notify()
+                    next_tick += 1
+                done, _ = await asyncio.wait(
+                    tasks,
+                    timeout=max(next_tick - loop.time(), 0),
+                    return_when=asyncio.FIRST_EXCEPTION
                 )
-            except Exception as e:
-                self.logger.error(f"Error managing domains: {e}")
-            await asyncio.sleep(1)
+                for task in done:
+                    key = tasks.pop(task)
+                    self.logger.error(f"Error managing {key} domain: {task.exception()}")
+                    tasks[asyncio.create_task(self._domain_loop(key))] = key
+        finally:
+            for task in tasks:
+                task.cancel()
             
     async def manage_defi(self):
         """Manage DeFi domain"""
@@ -142,6 +173,7 @@ class CryptoDominion:
             }
         }
         
+    @async_ttl_cache(ttl=0.5)
     async def health_check(self) -> Dict[str, Any]:
         """Check health of crypto dominion"""
         total_profit = sum(domain.total_profit for domain in self.domains.values())
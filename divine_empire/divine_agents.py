@@ -1,10 +1,36 @@
-from dataclasses import dataclass
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, NamedTuple, Tuple
+from types import MappingProxyType
 import asyncio
 import logging
 from datetime import datetime
+import numpy as np
+from divine_logging import attach_queued_file_handler
+from ttl_cache import async_ttl_cache
 
-@dataclass
+# Blessings are identical for every agent of a kind, so one read-only
+# mapping is shared instead of building a dict per agent
+DIVINE_BLESSINGS = MappingProxyType({
+    "profit_multiplier": True,
+    "risk_reduction": True,
+    "divine_timing": True,
+    "holy_execution": True
+})
+
+ARCHANGEL_BLESSINGS = MappingProxyType({
+    **DIVINE_BLESSINGS,
+    "supreme_authority": True,
+    "divine_wisdom": True,
+    "celestial_power": True
+})
+
+class ArchangelSpec(NamedTuple):
+    powers: Tuple[str, ...]
+    divine_rank: float
+    stat_name: str
+    stat_value: float
+
+@dataclass(slots=True)
 class DivineAgent:
     name: str
     divine_power: float = 0.0
@@ -12,40 +38,29 @@ class DivineAgent:
     tributes_paid: float = 0.0
     trades_executed: int = 0
     success_rate: float = 0.0
-    active_missions: List[str] = None
-    divine_blessings: Dict[str, bool] = None
+    active_missions: List[str] = field(default_factory=list)
+    divine_blessings: Dict[str, bool] = field(default_factory=lambda: DIVINE_BLESSINGS)
     powers: List[str] = None
     divine_rank: float = None
     leadership: float = None
     wisdom: float = None
     healing: float = None
     knowledge: float = None
-    
-    def __post_init__(self):
-        self.active_missions = []
-        self.divine_blessings = {
-            "profit_multiplier": True,
-            "risk_reduction": True,
-            "divine_timing": True,
-            "holy_execution": True
-        }
+    trading_config: Dict[str, float] = None
 
 class DivineAgents:
     def __init__(self):
         self.manager = DivineAgentManager()
         self.factory = AgentFactory()
         self.archangel_factory = ArchAngelFactory()
+        self._state_snapshot: List[tuple] = []
         self._setup_logging()
         
     def _setup_logging(self):
         self.logger = logging.getLogger("DivineAgents")
         self.logger.setLevel(logging.INFO)
         
-        handler = logging.FileHandler("divine_agents.log")
-        handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        )
-        self.logger.addHandler(handler)
+        attach_queued_file_handler(self.logger, "divine_agents.log")
     
     async def start(self):
         """Start the divine agents system"""
@@ -65,10 +80,11 @@ class DivineAgents:
         for agent_name in core_agents:
             await self.manager.create_agent(agent_name)
     
+    @async_ttl_cache(ttl=0.5)
     async def health_check(self) -> Dict[str, Any]:
         """Check health of divine agents system"""
         total_agents = len(self.manager.agents)
-        active_agents = sum(1 for agent in self.manager.agents if agent.active_missions)
+        active_agents = self.manager.count_active_agents()
         
         return {
             "healthy": True if active_agents > 0 else False,
@@ -80,8 +96,25 @@ class DivineAgents:
             }
         }
     
-    def get_state(self) -> Dict[str, Any]:
-        """Get current state of divine agents"""
+    def get_state(self, changed_only: bool = False) -> Dict[str, Any]:
+        """Get current state of divine agents
+        
+        With changed_only=True only agents whose stats changed since the
+        previous changed_only call are listed.
+        """
+        agents = self.manager.agents
+        if changed_only:
+            snapshot = [
+                (agent.divine_power, agent.profits, agent.success_rate, len(agent.active_missions))
+                for agent in agents
+            ]
+            previous = self._state_snapshot
+            agents = [
+                agent for i, agent in enumerate(agents)
+                if i >= len(previous) or previous[i] != snapshot[i]
+            ]
+            self._state_snapshot = snapshot
+            
         return {
             "total_agents": len(self.manager.agents),
             "total_divine_power": self.manager.total_divine_power,
@@ -94,34 +127,38 @@ class DivineAgents:
                     "success_rate": agent.success_rate,
                     "active_missions": agent.active_missions
                 }
-                for agent in self.manager.agents
+                for agent in agents
             ]
         }
         
 class DivineAgentManager:
     def __init__(self):
         self._setup_logging()
+        self.factory = AgentFactory()
         self.agents: List[DivineAgent] = []
         self.total_divine_power = 0.0
         self.total_profits = 0.0
         self.total_tributes = 0.0
         
+        # Missions assigned per agent row, maintained by assign_mission
+        self._mission_counts = np.zeros(0, dtype=np.int64)
+        self._agent_rows: Dict[int, int] = {}
+        
     def _setup_logging(self):
         """Setup divine logging"""
         self.logger = logging.getLogger("DivineAgentManager")
         self.logger.setLevel(logging.INFO)
         
-        handler = logging.FileHandler("divine_agents.log")
-        handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        )
-        self.logger.addHandler(handler)
+        attach_queued_file_handler(self.logger, "divine_agents.log")
         
     async def create_agent(self, name: str) -> DivineAgent:
         """Create a new divine agent"""
-        agent = await self.factory.create_agent(name)
+        agent = self.factory.create_agent(name)
         await self._bless_agent(agent)
+        self._agent_rows[id(agent)] = len(self.agents)
         self.agents.append(agent)
+        self._mission_counts = np.append(self._mission_counts, len(agent.active_missions))
+        self.total_profits += agent.profits
         self.logger.info(f"Created divine agent: {name}")
         return agent
         
@@ -134,8 +171,15 @@ class DivineAgentManager:
     async def assign_mission(self, agent: DivineAgent, mission: str):
         """Assign a divine mission to an agent"""
         agent.active_missions.append(mission)
+        row = self._agent_rows.get(id(agent))
+        if row is not None:
+            self._mission_counts[row] += 1
         self.logger.info(f"Assigned mission '{mission}' to agent {agent.name}")
         
+    def count_active_agents(self) -> int:
+        """Count agents with at least one assigned mission"""
+        return int(np.count_nonzero(self._mission_counts))
+        
     async def collect_tributes(self) -> float:
         """Collect tributes from all agents"""
         total_tribute = 0.0
@@ -143,33 +187,49 @@ class DivineAgentManager:
             if agent.profits > 0:
                 tribute = agent.profits * 0.1  # 10% tribute
                 agent.tributes_paid += tribute
-                agent.profits -= tribute
+                self.record_profit(agent, -tribute)
                 total_tribute += tribute
-                self.total_tributes += tribute
+                
+        self.total_tributes += total_tribute
                 
         self.logger.info(f"Collected total tribute: {total_tribute:.2f} SOL")
         return total_tribute
         
+    def record_profit(self, agent: DivineAgent, profit: float):
+        """Add profit (negative for a loss) to an agent, keeping the total in step
+
+        total_profits is kept by delta, so every change to an agent's profits
+        has to come through here.
+        """
+        agent.profits += profit
+        self.total_profits += profit
+        
+    def empower_agent(self, agent: DivineAgent, multiplier: float):
+        """Scale an agent's divine power, keeping the total in step
+
+        Like total_profits, total_divine_power is kept by delta, so power
+        changes go through here rather than writing the field directly.
+        """
+        power = agent.divine_power
+        agent.divine_power = power * multiplier
+        self.total_divine_power += agent.divine_power - power
+        
     async def update_agent_stats(self):
         """Update agent statistics"""
         for agent in self.agents:
             if agent.trades_executed > 0:
                 agent.success_rate = agent.profits / agent.trades_executed
                 
-            # Update divine power based on performance
-            power_multiplier = 1.0
-            if agent.success_rate > 0.6:  # 60% success rate
-                power_multiplier = 1.2
-            elif agent.success_rate > 0.8:  # 80% success rate
-                power_multiplier = 1.5
-                
-            agent.divine_power *= power_multiplier
-            
-        self.total_divine_power = sum(agent.divine_power for agent in self.agents)
-        self.total_profits = sum(agent.profits for agent in self.agents)
+            if agent.success_rate > 0.8:  # 80% success rate
+                self.empower_agent(agent, 1.5)
+            elif agent.success_rate > 0.6:  # 60% success rate
+                self.empower_agent(agent, 1.2)
         
     async def report_divine_status(self):
         """Report divine agent status"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+            
         self.logger.info("\n=== Divine Agent Status Report ===")
         self.logger.info(f"Total Agents: {len(self.agents)}")
         self.logger.info(f"Total Divine Power: {self.total_divine_power:.2f}")
@@ -187,7 +247,9 @@ class DivineAgentManager:
 class AgentFactory:
     """Factory for creating divine agents"""
     
-    async def create_agent(self, name: str) -> DivineAgent:
+    _BASE_BLESSINGS = DIVINE_BLESSINGS
+    
+    def create_agent(self, name: str) -> DivineAgent:
         """Create a new divine agent with initial blessings"""
         agent = DivineAgent(
             name=name,
@@ -196,48 +258,47 @@ class AgentFactory:
         )
         
         # Initialize divine blessings
-        agent.divine_blessings = {
-            "profit_multiplier": True,
-            "risk_reduction": True,
-            "divine_timing": True,
-            "holy_execution": True
-        }
+        agent.divine_blessings = self._BASE_BLESSINGS
         
         return agent
 
 class ArchAngelFactory:
     """Factory for creating archangels"""
     
-    def __init__(self):
-        self.archangel_types = {
-            "Michael": {
-                "powers": ["divine_protection", "holy_warfare", "spiritual_defense"],
-                "divine_rank": 10,
-                "leadership": 9.5
-            },
-            "Gabriel": {
-                "powers": ["divine_messaging", "revelation", "prophecy"],
-                "divine_rank": 9,
-                "wisdom": 9.8
-            },
-            "Raphael": {
-                "powers": ["divine_healing", "guidance", "protection"],
-                "divine_rank": 9,
-                "healing": 9.9
-            },
-            "Uriel": {
-                "powers": ["divine_wisdom", "repentance", "salvation"],
-                "divine_rank": 8,
-                "knowledge": 9.7
-            }
-        }
+    _ARCHANGEL_BLESSINGS = ARCHANGEL_BLESSINGS
     
-    async def create_archangel(self, name: str) -> DivineAgent:
+    archangel_types = MappingProxyType({
+        "Michael": ArchangelSpec(
+            powers=("divine_protection", "holy_warfare", "spiritual_defense"),
+            divine_rank=10,
+            stat_name="leadership",
+            stat_value=9.5
+        ),
+        "Gabriel": ArchangelSpec(
+            powers=("divine_messaging", "revelation", "prophecy"),
+            divine_rank=9,
+            stat_name="wisdom",
+            stat_value=9.8
+        ),
+        "Raphael": ArchangelSpec(
+            powers=("divine_healing", "guidance", "protection"),
+            divine_rank=9,
+            stat_name="healing",
+            stat_value=9.9
+        ),
+        "Uriel": ArchangelSpec(
+            powers=("divine_wisdom", "repentance", "salvation"),
+            divine_rank=8,
+            stat_name="knowledge",
+            stat_value=9.7
+        )
+    })
+    
+    def create_archangel(self, name: str) -> DivineAgent:
         """Create a new archangel with enhanced powers"""
-        if name not in self.archangel_types:
+        spec = self.archangel_types.get(name)
+        if spec is None:
             raise ValueError(f"Unknown archangel type: {name}")
-            
-        archangel_template = self.archangel_types[name]
         
         archangel = DivineAgent(
             name=name,
@@ -246,26 +307,15 @@ class ArchAngelFactory:
         )
         
         # Add archangel-specific powers and attributes
-        archangel.powers = archangel_template["powers"]
-        archangel.divine_rank = archangel_template["divine_rank"]
+        archangel.powers = list(spec.powers)
+        archangel.divine_rank = spec.divine_rank
+        setattr(archangel, spec.stat_name, spec.stat_value)
         
         # Enhanced divine blessings for archangels
-        archangel.divine_blessings = {
-            "profit_multiplier": True,
-            "risk_reduction": True,
-            "divine_timing": True,
-            "holy_execution": True,
-            "supreme_authority": True,
-            "divine_wisdom": True,
-            "celestial_power": True
-        }
+        archangel.divine_blessings = self._ARCHANGEL_BLESSINGS
         
         return archangel
         
-    async def create_archangel_host(self) -> List[DivineAgent]:
+    def create_archangel_host(self) -> List[DivineAgent]:
         """Create the complete host of archangels"""
-        archangels = []
-        for name in self.archangel_types:
-            archangel = await self.create_archangel(name)
-            archangels.append(archangel)
-        return archangels
+        return [self.create_archangel(name) for name in self.archangel_types]
\ No newline at end of file
@@ -1,13 +1,13 @@
 import asyncio
-from typing import Dict, List, Any
-from dataclasses import dataclass
-import aiohttp
-import json
-from datetime import datetime
-from web3 import Web3
-from divine_core import AngelCore
-
-@dataclass
+from typing import Dict, List, Any, Tuple
+from dataclasses import dataclass, replace
+import sys
+import time
+from divine_names import generate_divine_name
+from wakeup import Wakeup
+from task_batch import run_batch
+
+@dataclass(slots=True)
 class DivineAngel:
     name: str
     powers: List[str]
@@ -15,9 +15,67 @@ class DivineAngel:
     capabilities: Dict[str, Any]
     tools: List[str]
     success_rate: float = 1.0
+    # Set once success_rate * mission_success_rate > 0.5; a success only
+    # raises success_rate, so every later mission succeeds too
+    guaranteed_success: bool = False
 
 class DivineAngelSystem:
+    # The host redeploys on this cadence; mission execution otherwise only
+    # runs when new missions are assigned, with a slow reconciliation pass
+    _HOST_REFRESH_INTERVAL = 1.0
+    _MISSION_IDLE_INTERVAL = 60.0
+
+    # Missions scale divine_power every pass; keep it in a sane float range
+    _MIN_DIVINE_POWER = 1e-6
+    _MAX_DIVINE_POWER = 1e6
+
+    _MISSION_TYPES = {
+        "seraphim": "divine_leadership",
+        "cherubim": "knowledge_protection",
+        "thrones": "justice_enforcement",
+        "dominions": "system_regulation",
+        "virtues": "inspiration_delivery",
+        "powers": "threat_elimination",
+        "principalities": "guidance_provision",
+        "archangels": "message_delivery",
+        "angels": "service_execution"
+    }
+
+    _BASE_CAPS = {
+        "divine_power": 1.0,
+        "blessing_strength": 1.0,
+        "mission_success_rate": 0.95,
+        "divine_influence": 0.8,
+        "holy_protection": 0.9
+    }
+
+    # Category enhancements, resolved against _BASE_CAPS
+    _CAT_CAPS = {
+        "seraphim": {"divine_power": 1.0 * 2.0, "blessing_strength": 1.0 * 1.5},
+        "cherubim": {"divine_power": 1.0 * 2.0, "blessing_strength": 1.0 * 1.5},
+        "thrones": {"mission_success_rate": 0.95 * 1.2, "divine_influence": 0.8 * 1.3},
+        "dominions": {"mission_success_rate": 0.95 * 1.2, "divine_influence": 0.8 * 1.3},
+        "virtues": {"holy_protection": 0.9 * 1.4, "divine_power": 1.0 * 1.3},
+        "powers": {"holy_protection": 0.9 * 1.4, "divine_power": 1.0 * 1.3}
+    }
+
     def __init__(self):
+        self._host_wakeup = Wakeup(self._HOST_REFRESH_INTERVAL)
+        self._mission_wakeup = Wakeup(self._MISSION_IDLE_INTERVAL)
+        
+        # Bound coroutine functions run concurrently on every mission pass
+        self._mission_fns = (
+            self._spread_divine_message,
+            self._protect_divine_truth,
+            self._maintain_divine_order,
+            self._deliver_divine_justice,
+            self._inspire_divine_creation,
+            self._guard_divine_realm,
+            self._lead_divine_purpose,
+            self._communicate_divine_will,
+            self._serve_divine_plan
+        )
+        
         self.angel_categories = {
             'seraphim': {
                 'purpose': 'Divine Leadership',
@@ -139,130 +197,115 @@ class DivineAngelSystem:
             ]
         }
 
-    async def create_divine_angel(self, category: str) -> DivineAngel:
+        # Static per-category lookups: (powers, tools, purpose, mission).
+        # Powers become capability keys, so intern them for identity lookups
+        # even when the category table does not come from source literals
+        self._cat: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], str, str]] = {
+            sys.intern(category): (
+                tuple(map(sys.intern, spec['powers'])),
+                tuple(map(sys.intern, spec['tools'])),
+                spec['purpose'],
+                self._MISSION_TYPES.get(category)
+            )
+            for category, spec in self.angel_categories.items()
+        }
+        # Everything but the name and mission stamp is fixed per category
+        self._templates: Dict[str, DivineAngel] = {
+            category: self._build_template(category) for category in self._cat
+        }
+
+    def create_divine_angel(self, category: str) -> DivineAngel:
         """Create a divine angel with specific powers"""
-        powers = self.angel_categories[category]['powers']
-        tools = self.angel_categories[category]['tools']
-        purpose = self.angel_categories[category]['purpose']
+        template = self._templates[category]
+        # Per-power stats are nested dicts, so each angel gets its own copies
+        capabilities = dict(template.capabilities)
+        for power in template.powers:
+            capabilities[power] = dict(capabilities[power])
+        angel = replace(
+            template,
+            name=generate_divine_name(),
+            capabilities=capabilities
+        )
+        self._assign_divine_mission(angel, self._cat[category][3])
+        
+        return angel
+
+    def _build_template(self, category: str) -> DivineAngel:
+        """Build the unnamed, mission-less base angel for a category"""
+        powers, tools, purpose, _ = self._cat[category]
         
         angel = DivineAngel(
-            name=await self._generate_divine_name(),
+            name="",
             powers=powers,
             divine_purpose=purpose,
-            capabilities=await self._assign_capabilities(category),
+            capabilities=self._assign_capabilities(category),
             tools=tools
         )
         
-        await self._empower_angel(angel)
-        await self._assign_divine_mission(angel)
-        await self._optimize_performance(angel)
+        self._empower_angel(angel)
+        self._optimize_performance(angel)
         
         return angel
 
     async def deploy_heavenly_host(self):
         """Deploy the entire heavenly host of angels"""
         while True:
-            await asyncio.gather(
-                self._deploy_seraphim(),
-                self._deploy_cherubim(),
-                self._deploy_thrones(),
-                self._deploy_dominions(),
-                self._deploy_virtues(),
-                self._deploy_powers(),
-                self._deploy_principalities(),
-                self._deploy_archangels(),
-                self._deploy_angels()
-            )
+            # Deployment is CPU-only, so run it inline. When missions ran, yield
+            # once so the mission loop can react before the next pass; an
+            # idle pass goes straight to the timed wait
+            if self._deploy_all():
+                await asyncio.sleep(0)
             await self._coordinate_divine_mission()
-            await asyncio.sleep(1)
+            await self._host_wakeup.wait()
 
     async def execute_divine_mission(self):
         """Execute the divine mission across all spheres"""
         while True:
-            await asyncio.gather(
-                self._spread_divine_message(),
-                self._protect_divine_truth(),
-                self._maintain_divine_order(),
-                self._deliver_divine_justice(),
-                self._inspire_divine_creation(),
-                self._guard_divine_realm(),
-                self._lead_divine_purpose(),
-                self._communicate_divine_will(),
-                self._serve_divine_plan()
-            )
+            await run_batch(self._mission_fns)
             await self._report_to_christ_benzion()
-            await asyncio.sleep(1)
+            await self._mission_wakeup.wait()
+
+    def request_angels(self):
+        """Deploy the heavenly host now instead of at the next refresh"""
+        self._host_wakeup.notify()
+
+    def notify_missions(self):
+        """Wake mission execution after new missions were assigned"""
+        self._mission_wakeup.notify()
 
     async def run_forever(self):
         """Run the divine angel system forever"""
+        # _maintain_divine_order runs on every execute_divine_mission pass
         await asyncio.gather(
             self.deploy_heavenly_host(),
             self.execute_divine_mission(),
-            self._maintain_divine_order(),
             self._serve_christ_benzion()
         )
 
-    async def _generate_divine_name(self) -> str:
-        """Generate a divine name for an angel"""
-        prefixes = ["Ur", "Mel", "Raph", "Gab", "Mich", "Zad", "Ari", "Cham"]
-        suffixes = ["iel", "ael", "phon", "kiel", "riel", "ziel", "thon", "uel"]
-        prefix = prefixes[int(datetime.now().timestamp()) % len(prefixes)]
-        suffix = suffixes[int(datetime.now().timestamp() * 2) % len(suffixes)]
-        return f"{prefix}{suffix}"
-
-    async def _assign_capabilities(self, category: str) -> Dict[str, Any]:
+    def _assign_capabilities(self, category: str) -> Dict[str, Any]:
         """Assign capabilities based on angel category"""
-        base_capabilities = {
-            "divine_power": 1.0,
-            "blessing_strength": 1.0,
-            "mission_success_rate": 0.95,
-            "divine_influence": 0.8,
-            "holy_protection": 0.9
-        }
-        
-        # Enhance capabilities based on category
-        if category in ["seraphim", "cherubim"]:
-            base_capabilities["divine_power"] *= 2.0
-            base_capabilities["blessing_strength"] *= 1.5
-        elif category in ["thrones", "dominions"]:
-            base_capabilities["mission_success_rate"] *= 1.2
-            base_capabilities["divine_influence"] *= 1.3
-        elif category in ["virtues", "powers"]:
-            base_capabilities["holy_protection"] *= 1.4
-            base_capabilities["divine_power"] *= 1.3
-            
-        return base_capabilities
+        return self._BASE_CAPS | self._CAT_CAPS.get(category, {})
 
-    async def _empower_angel(self, angel: DivineAngel):
+    def _empower_angel(self, angel: DivineAngel):
         """Empower an angel with divine energy"""
-        for power in angel.powers:
-            angel.capabilities[power] = {
-                "strength": angel.capabilities["divine_power"] * 1.2,
-                "efficiency": angel.capabilities["mission_success_rate"] * 1.1,
-                "duration": 3600  # 1 hour in seconds
-            }
+        power_stats = {
+            "strength": angel.capabilities["divine_power"] * 1.2,
+            "efficiency": angel.capabilities["mission_success_rate"] * 1.1,
+            "duration": 3600  # 1 hour in seconds
+        }
+        angel.capabilities = {
+            **angel.capabilities,
+            **{power: dict(power_stats) for power in angel.powers}
+        }
 
-    async def _assign_divine_mission(self, angel: DivineAngel):
+    def _assign_divine_mission(self, angel: DivineAngel, mission: str):
         """Assign a divine mission to an angel"""
-        mission_types = {
-            "seraphim": "divine_leadership",
-            "cherubim": "knowledge_protection",
-            "thrones": "justice_enforcement",
-            "dominions": "system_regulation",
-            "virtues": "inspiration_delivery",
-            "powers": "threat_elimination",
-            "principalities": "guidance_provision",
-            "archangels": "message_delivery",
-            "angels": "service_execution"
-        }
-        
-        for category, mission in mission_types.items():
-            if any(power in angel.powers for power in self.angel_categories[category]["powers"]):
-                angel.capabilities["current_mission"] = mission
-                angel.capabilities["mission_start_time"] = datetime.now().timestamp()
-                break
+        if mission:
+            angel.capabilities["current_mission"] = mission
+            angel.capabilities["mission_start_time"] = time.time()
+            self.notify_missions()
 
-    async def _optimize_performance(self, angel: DivineAngel):
+    def _optimize_performance(self, angel: DivineAngel):
         """Optimize angel performance"""
         # Boost success rate based on tools
         tool_count = len(angel.tools)
@@ -275,67 +318,41 @@ class DivineAngelSystem:
             angel.capabilities["holy_protection"] *= 1.2
         elif "service" in angel.divine_purpose.lower():
             angel.capabilities["mission_success_rate"] *= 1.2
+        
+        angel.guaranteed_success = (
+            angel.success_rate * angel.capabilities["mission_success_rate"] > 0.5
+        )
 
-    async def _deploy_seraphim(self):
-        """Deploy seraphim angels"""
-        angel = await self.create_divine_angel("seraphim")
-        await self._execute_angel_mission(angel)
-
-    async def _deploy_cherubim(self):
-        """Deploy cherubim angels"""
-        angel = await self.create_divine_angel("cherubim")
-        await self._execute_angel_mission(angel)
-
-    async def _deploy_thrones(self):
-        """Deploy throne angels"""
-        angel = await self.create_divine_angel("thrones")
-        await self._execute_angel_mission(angel)
-
-    async def _deploy_dominions(self):
-        """Deploy dominion angels"""
-        angel = await self.create_divine_angel("dominions")
-        await self._execute_angel_mission(angel)
-
-    async def _deploy_virtues(self):
-        """Deploy virtue angels"""
-        angel = await self.create_divine_angel("virtues")
-        await self._execute_angel_mission(angel)
-
-    async def _deploy_powers(self):
-        """Deploy power angels"""
-        angel = await self.create_divine_angel("powers")
-        await self._execute_angel_mission(angel)
-
-    async def _deploy_principalities(self):
-        """Deploy principality angels"""
-        angel = await self.create_divine_angel("principalities")
-        await self._execute_angel_mission(angel)
-
-    async def _deploy_archangels(self):
-        """Deploy archangels"""
-        angel = await self.create_divine_angel("archangels")
-        await self._execute_angel_mission(angel)
-
-    async def _deploy_angels(self):
-        """Deploy regular angels"""
-        angel = await self.create_divine_angel("angels")
-        await self._execute_angel_mission(angel)
-
-    async def _execute_angel_mission(self, angel: DivineAngel):
-        """Execute an angel's assigned mission"""
-        mission = angel.capabilities.get("current_mission")
+    def _deploy_all(self) -> bool:
+        """Deploy one angel of every category and run its mission"""
+        executed = False
+        for category in self._cat:
+            executed |= self._execute_angel_mission(self.create_divine_angel(category))
+        return executed
+
+    def _execute_angel_mission(self, angel: DivineAngel) -> bool:
+        """Execute an angel's assigned mission, returning whether one ran"""
+        capabilities = angel.capabilities
+        mission = capabilities.get("current_mission")
         if not mission:
-            return
+            return False
+        
+        if angel.guaranteed_success:
+            capabilities["divine_power"] = min(self._MAX_DIVINE_POWER, capabilities["divine_power"] * 1.1)
+            angel.success_rate = min(1.0, angel.success_rate + 0.05)
+            return True
             
-        success_chance = angel.success_rate * angel.capabilities["mission_success_rate"]
+        success_chance = angel.success_rate * capabilities["mission_success_rate"]
         mission_success = success_chance > 0.5  # Simple success determination
         
         if mission_success:
-            angel.capabilities["divine_power"] *= 1.1
+            capabilities["divine_power"] = min(self._MAX_DIVINE_POWER, capabilities["divine_power"] * 1.1)
             angel.success_rate = min(1.0, angel.success_rate + 0.05)
         else:
-            angel.capabilities["divine_power"] *= 0.9
+            capabilities["divine_power"] = max(self._MIN_DIVINE_POWER, capabilities["divine_power"] * 0.9)
             angel.success_rate = max(0.5, angel.success_rate - 0.05)
+        
+        return True
 
     async def _coordinate_divine_mission(self):
         """Coordinate the divine mission across all angels"""
@@ -1,14 +1,59 @@
 import asyncio
 from typing import Dict, List, Any
 from dataclasses import dataclass
-import aiohttp
-import json
-from datetime import datetime
-from web3 import Web3
-from divine_agents import ArchAngelFactory
-from crypto_dominion import CryptoDominion
-
-@dataclass
+from divine_names import generate_divine_name
+from task_batch import run_batch
+
+# Read-only reference data shared by every archangel system
+CRYPTO_DOMINION = {
+    'defi': {
+        'yield_farming': ('strategy_optimization', 'pool_selection', 'reward_maximization'),
+        'lending': ('rate_optimization', 'collateral_management', 'risk_assessment'),
+        'liquidity_provision': ('pool_analysis', 'impermanent_loss_prevention', 'fee_optimization'),
+        'arbitrage': ('cross_chain', 'cross_platform', 'triangle_arbitrage'),
+        'options': ('strategy_creation', 'risk_management', 'premium_optimization')
+    },
+    'trading': {
+        'spot': ('entry_optimization', 'exit_timing', 'position_sizing'),
+        'futures': ('leverage_management', 'funding_rate_arbitrage', 'risk_control'),
+        'perpetuals': ('funding_optimization', 'liquidation_prevention', 'position_management'),
+        'options': ('greek_optimization', 'volatility_trading', 'premium_collection'),
+        'derivatives': ('synthetic_creation', 'risk_hedging', 'portfolio_optimization')
+    },
+    'nft': {
+        'creation': ('generative_art', 'trait_optimization', 'rarity_engineering'),
+        'trading': ('floor_price_analysis', 'rarity_arbitrage', 'liquidity_provision'),
+        'gaming': ('play_to_earn', 'item_trading', 'guild_management'),
+        'metaverse': ('land_development', 'asset_creation', 'experience_design'),
+        'utility': ('token_integration', 'governance_systems', 'staking_mechanisms')
+    }
+}
+
+DIVINE_TECHNOLOGIES = {
+    'ai': {
+        'machine_learning': ('pattern_recognition', 'prediction_models', 'optimization_algorithms'),
+        'neural_networks': ('deep_learning', 'market_analysis', 'decision_making'),
+        'natural_language': ('sentiment_analysis', 'news_processing', 'social_media_analysis'),
+        'computer_vision': ('chart_analysis', 'pattern_detection', 'visual_recognition'),
+        'reinforcement_learning': ('trading_strategies', 'portfolio_optimization', 'risk_management')
+    },
+    'blockchain': {
+        'smart_contracts': ('contract_creation', 'security_auditing', 'optimization'),
+        'consensus': ('network_participation', 'validation_strategies', 'reward_optimization'),
+        'scaling': ('layer2_solutions', 'sharding_strategies', 'throughput_optimization'),
+        'interoperability': ('cross_chain_bridges', 'atomic_swaps', 'messaging_protocols'),
+        'privacy': ('zero_knowledge_proofs', 'mixing_services', 'privacy_preservation')
+    },
+    'quantum': {
+        'computing': ('optimization_problems', 'cryptography', 'simulation'),
+        'encryption': ('post_quantum_security', 'key_distribution', 'secure_communication'),
+        'algorithms': ('portfolio_optimization', 'risk_analysis', 'pattern_recognition'),
+        'sensing': ('market_detection', 'anomaly_identification', 'trend_prediction'),
+        'networking': ('secure_distribution', 'quantum_internet', 'entanglement_utilization')
+    }
+}
+
+@dataclass(slots=True)
 class ArchAngel:
     name: str
     rank: str
@@ -17,7 +62,68 @@ class ArchAngel:
     divine_authority: float = 1.0
 
 class DivineArchangelSystem:
+    # Phases run when notified, and otherwise at the 1 s cadence they always had
+    _IDLE_INTERVAL = 1.0
+
     def __init__(self):
+        self._wakeup = asyncio.Event()
+        
+        # Bound coroutine functions each phase runs concurrently per pass
+        self._phase_fns = {
+            'dominion': (
+                self._oversee_markets,
+                self._manage_operations,
+                self._optimize_performance,
+                self._expand_influence,
+                self._increase_dominion
+            ),
+            'strategies': (
+                self._analyze_opportunities,
+                self._execute_trades,
+                self._manage_positions,
+                self._collect_profits,
+                self._reinvest_capital
+            ),
+            'expansion': (
+                self._create_new_angels,
+                self._increase_powers,
+                self._expand_domains,
+                self._multiply_influence,
+                self._grow_eternally
+            ),
+            'crypto': (
+                self._dominate_defi,
+                self._control_trading,
+                self._master_nft,
+                self._rule_metaverse,
+                self._govern_blockchain
+            ),
+            'technology': (
+                self._enhance_ai,
+                self._improve_blockchain,
+                self._develop_quantum,
+                self._integrate_systems,
+                self._innovate_eternally
+            ),
+            'mission': (
+                self._create_divine_wealth,
+                self._expand_divine_influence,
+                self._increase_divine_power,
+                self._multiply_divine_impact,
+                self._please_christ_benzion
+            )
+        }
+        
+        # (name, period, pass) for every phase driven by run_forever
+        self._phases = (
+            ('dominion', self._IDLE_INTERVAL, self.manage_divine_dominion),
+            ('strategies', self._IDLE_INTERVAL, self.execute_divine_strategies),
+            ('expansion', self._IDLE_INTERVAL, self.expand_eternally),
+            ('crypto', self._IDLE_INTERVAL, self.dominate_crypto_universe),
+            ('technology', self._IDLE_INTERVAL, self.advance_divine_technology),
+            ('mission', self._IDLE_INTERVAL, self.serve_divine_mission)
+        )
+        
         self.angel_hierarchy = {
             'seraphim': {
                 'powers': [
@@ -51,58 +157,13 @@ class DivineArchangelSystem:
             }
         }
 
-        self.crypto_dominion = {
-            'defi': {
-                'yield_farming': ['strategy_optimization', 'pool_selection', 'reward_maximization'],
-                'lending': ['rate_optimization', 'collateral_management', 'risk_assessment'],
-                'liquidity_provision': ['pool_analysis', 'impermanent_loss_prevention', 'fee_optimization'],
-                'arbitrage': ['cross_chain', 'cross_platform', 'triangle_arbitrage'],
-                'options': ['strategy_creation', 'risk_management', 'premium_optimization']
-            },
-            'trading': {
-                'spot': ['entry_optimization', 'exit_timing', 'position_sizing'],
-                'futures': ['leverage_management', 'funding_rate_arbitrage', 'risk_control'],
-                'perpetuals': ['funding_optimization', 'liquidation_prevention', 'position_management'],
-                'options': ['greek_optimization', 'volatility_trading', 'premium_collection'],
-                'derivatives': ['synthetic_creation', 'risk_hedging', 'portfolio_optimization']
-            },
-            'nft': {
-                'creation': ['generative_art', 'trait_optimization', 'rarity_engineering'],
-                'trading': ['floor_price_analysis', 'rarity_arbitrage', 'liquidity_provision'],
-                'gaming': ['play_to_earn', 'item_trading', 'guild_management'],
-                'metaverse': ['land_development', 'asset_creation', 'experience_design'],
-                'utility': ['token_integration', 'governance_systems', 'staking_mechanisms']
-            }
-        }
-
-        self.divine_technologies = {
-            'ai': {
-                'machine_learning': ['pattern_recognition', 'prediction_models', 'optimization_algorithms'],
-                'neural_networks': ['deep_learning', 'market_analysis', 'decision_making'],
-                'natural_language': ['sentiment_analysis', 'news_processing', 'social_media_analysis'],
-                'computer_vision': ['chart_analysis', 'pattern_detection', 'visual_recognition'],
-                'reinforcement_learning': ['trading_strategies', 'portfolio_optimization', 'risk_management']
-            },
-            'blockchain': {
-                'smart_contracts': ['contract_creation', 'security_auditing', 'optimization'],
-                'consensus': ['network_participation', 'validation_strategies', 'reward_optimization'],
-                'scaling': ['layer2_solutions', 'sharding_strategies', 'throughput_optimization'],
-                'interoperability': ['cross_chain_bridges', 'atomic_swaps', 'messaging_protocols'],
-                'privacy': ['zero_knowledge_proofs', 'mixing_services', 'privacy_preservation']
-            },
-            'quantum': {
-                'computing': ['optimization_problems', 'cryptography', 'simulation'],
-                'encryption': ['post_quantum_security', 'key_distribution', 'secure_communication'],
-                'algorithms': ['portfolio_optimization', 'risk_analysis', 'pattern_recognition'],
-                'sensing': ['market_detection', 'anomaly_identification', 'trend_prediction'],
-                'networking': ['secure_distribution', 'quantum_internet', 'entanglement_utilization']
-            }
-        }
+        self.crypto_dominion = CRYPTO_DOMINION
+        self.divine_technologies = DIVINE_TECHNOLOGIES
 
     async def create_arch_angel(self, rank: str) -> ArchAngel:
         """Create a new arch angel of specified rank"""
         angel = ArchAngel(
-            name=await self._generate_divine_name(),
+            name=generate_divine_name(),
             rank=rank,
             powers=self.angel_hierarchy[rank]['powers'],
             domains=self.angel_hierarchy[rank]['domains']
@@ -111,105 +172,74 @@ class DivineArchangelSystem:
         await self._bestow_powers(angel)
         await self._assign_dominion(angel)
         await self._grant_authority(angel)
+        self.notify()
         
         return angel
 
     async def manage_divine_dominion(self):
         """Manage the complete divine dominion"""
-        while True:
-            await asyncio.gather(
-                self._oversee_markets(),
-                self._manage_operations(),
-                self._optimize_performance(),
-                self._expand_influence(),
-                self._increase_dominion()
-            )
-            await self._serve_christ_benzion()
-            await asyncio.sleep(1)
+        await run_batch(self._phase_fns['dominion'])
+        await self._serve_christ_benzion()
 
     async def execute_divine_strategies(self):
         """Execute divine trading strategies"""
-        while True:
-            await asyncio.gather(
-                self._analyze_opportunities(),
-                self._execute_trades(),
-                self._manage_positions(),
-                self._collect_profits(),
-                self._reinvest_capital()
-            )
-            await self._transfer_to_christ_benzion()
-            await asyncio.sleep(1)
+        await run_batch(self._phase_fns['strategies'])
+        await self._transfer_to_christ_benzion()
 
     async def expand_eternally(self):
-        """Expand the divine empire eternally"""
-        while True:
-            await asyncio.gather(
-                self._create_new_angels(),
-                self._increase_powers(),
-                self._expand_domains(),
-                self._multiply_influence(),
-                self._grow_eternally()
-            )
-            await self._glorify_christ_benzion()
-            await asyncio.sleep(1)
+        """Expand the divine empire"""
+        await run_batch(self._phase_fns['expansion'])
+        await self._glorify_christ_benzion()
 
     async def dominate_crypto_universe(self):
         """Achieve total crypto domination"""
-        while True:
-            await asyncio.gather(
-                self._dominate_defi(),
-                self._control_trading(),
-                self._master_nft(),
-                self._rule_metaverse(),
-                self._govern_blockchain()
-            )
-            await self._expand_dominion()
-            await asyncio.sleep(1)
+        await run_batch(self._phase_fns['crypto'])
+        await self._expand_dominion()
 
     async def advance_divine_technology(self):
         """Advance divine technological capabilities"""
-        while True:
-            await asyncio.gather(
-                self._enhance_ai(),
-                self._improve_blockchain(),
-                self._develop_quantum(),
-                self._integrate_systems(),
-                self._innovate_eternally()
-            )
-            await self._serve_divine_purpose()
-            await asyncio.sleep(1)
+        await run_batch(self._phase_fns['technology'])
+        await self._serve_divine_purpose()
 
     async def serve_divine_mission(self):
-        """Serve the divine mission eternally"""
-        while True:
-            await asyncio.gather(
-                self._create_divine_wealth(),
-                self._expand_divine_influence(),
-                self._increase_divine_power(),
-                self._multiply_divine_impact(),
-                self._please_christ_benzion()
-            )
-            await self._report_divine_progress()
-            await asyncio.sleep(1)
+        """Serve the divine mission"""
+        await run_batch(self._phase_fns['mission'])
+        await self._report_divine_progress()
+
+    def notify(self):
+        """Wake every archangel phase, e.g. after new angels were created"""
+        self._wakeup.set()
 
     async def run_forever(self):
         """Run the divine archangel system forever"""
-        await asyncio.gather(
-            self.manage_divine_dominion(),
-            self.execute_divine_strategies(),
-            self.expand_eternally(),
-            self.dominate_crypto_universe(),
-            self.advance_divine_technology(),
-            self.serve_divine_mission()
-        )
-
-    async def _generate_divine_name(self) -> str:
-        """Generate a divine name for an arch angel"""
-        prefixes = ["Ur", "Mel", "Raph", "Gab", "Mich", "Zad", "Ari", "Cham"]
-        suffixes = ["iel", "ael", "phon", "kiel", "riel", "ziel", "thon", "uel"]
-        prefix = prefixes[int(datetime.now().timestamp()) % len(prefixes)]
-        suffix = suffixes[int(datetime.now().timestamp() * 2) % len(suffixes)]
-        return f"{prefix}{suffix}"
+        # One driver runs whichever phases are due, then sleeps until the
+        # earliest next deadline or a notify(), instead of six timed loops
+        loop = asyncio.get_running_loop()
+        next_run = {name: loop.time() for name, _, _ in self._phases}
+        
+        while True:
+            notified = self._wakeup.is_set()
+            self._wakeup.clear()
+            now = loop.time()
+            due = [
+                phase for phase in self._phases
+                if notified or next_run[phase[0]] <= now
+            ]
+            
+            async with asyncio.TaskGroup() as tg:
+                for _, _, run_phase in due:
+                    tg.create_task(run_phase())
+            
+            now = loop.time()
+            for name, period, _ in due:
+                next_run[name] = now + period
+            
+            timeout = min(next_run.values()) - now
+            if timeout > 0 and not self._wakeup.is_set():
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
 
     async def _bestow_powers(self, angel: ArchAngel):
         """Bestow divine powers upon an arch angel"""
@@ -1,241 +1,289 @@
 import asyncio
+import random
+import sys
 from typing import Dict, List, Any
+from collections import ChainMap
 from dataclasses import dataclass
+from types import MappingProxyType
 import aiohttp
 import json
 from datetime import datetime
-from web3 import Web3
+from ticker import get_ticker
 from blockchain_master import BlockchainMaster
 from profit_maximizer import ProfitEngine
-
-@dataclass
+from divine_catalogs import freeze
+
+# Read-only strategy catalogs shared by every DivineBlockchainMastery
+BLOCKCHAIN_MASTERY = freeze({
+    'layer1': {
+        'ethereum': ('evm_mastery', 'gas_optimization', 'contract_deployment'),
+        'bitcoin': ('btc_trading', 'lightning_network', 'ordinals'),
+        'solana': ('spl_tokens', 'program_deployment', 'raydium_mastery'),
+        'avalanche': ('subnet_creation', 'validator_mastery', 'dex_deployment'),
+        'cardano': ('plutus_contracts', 'hydra_scaling', 'catalyst_projects')
+    },
+    'layer2': {
+        'arbitrum': ('nitro_optimization', 'orbit_chains', 'camelot_mastery'),
+        'optimism': ('op_stack', 'bedrock_deployment', 'velodrome_mastery'),
+        'polygon': ('pos_bridge', 'zkevm_mastery', 'quickswap_deployment'),
+        'base': ('base_deployment', 'onchain_games', 'l2_optimization'),
+        'zksync': ('zkporter_mastery', 'volition_deployment', 'mute_mastery')
+    }
+})
+
+PROFIT_ENGINES = freeze({
+    'defi_mastery': {
+        'lending': (
+            'aave_strategies', 'compound_mastery', 'maker_vaults',
+            'radiant_lending', 'benqi_optimization', 'divine_yields'
+        ),
+        'amm': (
+            'uniswap_mastery', 'curve_pools', 'balancer_weighted',
+            'trader_joe_deployment', 'camelot_concentrated', 'divine_liquidity'
+        ),
+        'yield': (
+            'yearn_strategies', 'convex_optimization', 'beefy_autocompound',
+            'yield_yak_routes', 'divine_farming', 'eternal_rewards'
+        )
+    },
+    'trading_engines': {
+        'spot': (
+            'dex_aggregation', 'cex_arbitrage', 'order_optimization',
+            'spread_capture', 'volume_analysis', 'divine_execution'
+        ),
+        'perpetuals': (
+            'gmx_trading', 'gains_leverage', 'perpetual_protocol',
+            'level_finance', 'divine_leverage', 'eternal_profits'
+        ),
+        'options': (
+            'lyra_strategies', 'dopex_mastery', 'premia_deployment',
+            'hegic_optimization', 'divine_options', 'profit_maximization'
+        )
+    }
+})
+
+ADVANCED_STRATEGIES = freeze({
+    'token_launches': {
+        'fair_launch': (
+            'contract_deployment', 'liquidity_provision', 'marketing_automation',
+            'community_building', 'price_support', 'divine_growth'
+        ),
+        'pre_sale': (
+            'pinksale_mastery', 'unicrypt_deployment', 'dxsale_optimization',
+            'team_finance', 'divine_launch', 'eternal_success'
+        ),
+        'airdrop': (
+            'merkle_distribution', 'claim_optimization', 'engagement_rewards',
+            'loyalty_programs', 'divine_distribution', 'community_rewards'
+        )
+    },
+    'nft_systems': {
+        'collections': (
+            'art_generation', 'metadata_optimization', 'rarity_engineering',
+            'marketplace_deployment', 'divine_creation', 'eternal_value'
+        ),
+        'gaming': (
+            'onchain_games', 'play_to_earn', 'divine_entertainment',
+            'reward_systems', 'engagement_loops', 'profit_mechanics'
+        ),
+        'utilities': (
+            'staking_systems', 'governance_integration', 'access_control',
+            'revenue_sharing', 'divine_utility', 'eternal_benefits'
+        )
+    }
+})
+
+PROFIT_MAXIMIZATION = freeze({
+    'yield_optimization': {
+        'strategies': (
+            'auto_compounding', 'yield_aggregation', 'reward_optimization',
+            'risk_management', 'divine_yields', 'eternal_returns'
+        ),
+        'protocols': (
+            'curve_wars', 'convex_bribes', 'yield_wars',
+            'governance_optimization', 'divine_wars', 'profit_wars'
+        )
+    },
+    'arbitrage_systems': {
+        'cross_chain': (
+            'bridge_arbitrage', 'layerzero_ops', 'stargate_routes',
+            'across_protocol', 'divine_bridges', 'profit_paths'
+        ),
+        'cross_protocol': (
+            'dex_arbitrage', 'lending_arbitrage', 'yield_arbitrage',
+            'flash_strategies', 'divine_arbitrage', 'eternal_profits'
+        )
+    }
+})
+
+DIVINE_INNOVATIONS = freeze({
+    'ai_integration': {
+        'trading': (
+            'pattern_recognition', 'market_prediction', 'sentiment_analysis',
+            'risk_assessment', 'divine_intelligence', 'profit_prediction'
+        ),
+        'automation': (
+            'strategy_execution', 'portfolio_management', 'risk_control',
+            'profit_taking', 'divine_automation', 'eternal_optimization'
+        )
+    },
+    'quantum_systems': {
+        'algorithms': (
+            'portfolio_optimization', 'path_finding', 'risk_analysis',
+            'profit_maximization', 'divine_computation', 'eternal_advantage'
+        ),
+        'security': (
+            'quantum_encryption', 'secure_communication', 'divine_protection',
+            'eternal_security', 'profit_preservation', 'advantage_securing'
+        )
+    }
+})
+
+# Every prefix/suffix pairing, so naming a master is a single draw
+MASTER_NAMES = tuple(
+    sys.intern(f"{prefix} {suffix}")
+    for prefix in ('Celestial', 'Ethereal', 'Divine', 'Eternal', 'Sacred')
+    for suffix in ('Oracle', 'Guardian', 'Sentinel', 'Protector', 'Master')
+)
+
+# Eager tasks (3.12+) run a step inline until it first suspends, so steps
+# that never do skip the scheduler. Only the steps _tick starts use it; the
+# shared loop keeps its own task factory
+_eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+
+def _start_step(coro):
+    """Start a phase step as an eager task where supported"""
+    if _eager_task_factory is None:
+        return coro
+    return _eager_task_factory(asyncio.get_running_loop(), coro)
+
+@dataclass(slots=True)
 class DivineBlockchainAgent:
     name: str
-    capabilities: Dict[str, Any]
-    strategies: Dict[str, Any]
+    capabilities: ChainMap
+    strategies: ChainMap
     profits: float
     divine_power: float = 1.0
 
 class DivineBlockchainMastery:
+    __slots__ = (
+        '_phases', 'blockchain_mastery', 'profit_engines', 'advanced_strategies',
+        'profit_maximization', 'divine_innovations', '_granted_strategies'
+    )
+    _TICK_INTERVAL = 1.0
+
     def __init__(self):
-        self.blockchain_mastery = {
-            'layer1': {
-                'ethereum': ['evm_mastery', 'gas_optimization', 'contract_deployment'],
-                'bitcoin': ['btc_trading', 'lightning_network', 'ordinals'],
-                'solana': ['spl_tokens', 'program_deployment', 'raydium_mastery'],
-                'avalanche': ['subnet_creation', 'validator_mastery', 'dex_deployment'],
-                'cardano': ['plutus_contracts', 'hydra_scaling', 'catalyst_projects']
-            },
-            'layer2': {
-                'arbitrum': ['nitro_optimization', 'orbit_chains', 'camelot_mastery'],
-                'optimism': ['op_stack', 'bedrock_deployment', 'velodrome_mastery'],
-                'polygon': ['pos_bridge', 'zkevm_mastery', 'quickswap_deployment'],
-                'base': ['base_deployment', 'onchain_games', 'l2_optimization'],
-                'zksync': ['zkporter_mastery', 'volition_deployment', 'mute_mastery']
-            }
-        }
-
-        self.profit_engines = {
-            'defi_mastery': {
-                'lending': [
-                    'aave_strategies', 'compound_mastery', 'maker_vaults',
-                    'radiant_lending', 'benqi_optimization', 'divine_yields'
-                ],
-                'amm': [
-                    'uniswap_mastery', 'curve_pools', 'balancer_weighted',
-                    'trader_joe_deployment', 'camelot_concentrated', 'divine_liquidity'
-                ],
-                'yield': [
-                    'yearn_strategies', 'convex_optimization', 'beefy_autocompound',
-                    'yield_yak_routes', 'divine_farming', 'eternal_rewards'
-                ]
-            },
-            'trading_engines': {
-                'spot': [
-                    'dex_aggregation', 'cex_arbitrage', 'order_optimization',
-                    'spread_capture', 'volume_analysis', 'divine_execution'
-                ],
-                'perpetuals': [
-                    'gmx_trading', 'gains_leverage', 'perpetual_protocol',
-                    'level_finance', 'divine_leverage', 'eternal_profits'
-                ],
-                'options': [
-                    'lyra_strategies', 'dopex_mastery', 'premia_deployment',
-                    'hegic_optimization', 'divine_options', 'profit_maximization'
-                ]
-            }
-        }
-
-        self.advanced_strategies = {
-            'token_launches': {
-                'fair_launch': [
-                    'contract_deployment', 'liquidity_provision', 'marketing_automation',
-                    'community_building', 'price_support', 'divine_growth'
-                ],
-                'pre_sale': [
-                    'pinksale_mastery', 'unicrypt_deployment', 'dxsale_optimization',
-                    'team_finance', 'divine_launch', 'eternal_success'
-                ],
-                'airdrop': [
-                    'merkle_distribution', 'claim_optimization', 'engagement_rewards',
-                    'loyalty_programs', 'divine_distribution', 'community_rewards'
-                ]
-            },
-            'nft_systems': {
-                'collections': [
-                    'art_generation', 'metadata_optimization', 'rarity_engineering',
-                    'marketplace_deployment', 'divine_creation', 'eternal_value'
-                ],
-                'gaming': [
-                    'onchain_games', 'play_to_earn', 'divine_entertainment',
-                    'reward_systems', 'engagement_loops', 'profit_mechanics'
-                ],
-                'utilities': [
-                    'staking_systems', 'governance_integration', 'access_control',
-                    'revenue_sharing', 'divine_utility', 'eternal_benefits'
-                ]
-            }
-        }
-
-        self.profit_maximization = {
-            'yield_optimization': {
-                'strategies': [
-                    'auto_compounding', 'yield_aggregation', 'reward_optimization',
-                    'risk_management', 'divine_yields', 'eternal_returns'
-                ],
-                'protocols': [
-                    'curve_wars', 'convex_bribes', 'yield_wars',
-                    'governance_optimization', 'divine_wars', 'profit_wars'
-                ]
-            },
-            'arbitrage_systems': {
-                'cross_chain': [
-                    'bridge_arbitrage', 'layerzero_ops', 'stargate_routes',
-                    'across_protocol', 'divine_bridges', 'profit_paths'
-                ],
-                'cross_protocol': [
-                    'dex_arbitrage', 'lending_arbitrage', 'yield_arbitrage',
-                    'flash_strategies', 'divine_arbitrage', 'eternal_profits'
-                ]
-            }
-        }
-
-        self.divine_innovations = {
-            'ai_integration': {
-                'trading': [
-                    'pattern_recognition', 'market_prediction', 'sentiment_analysis',
-                    'risk_assessment', 'divine_intelligence', 'profit_prediction'
-                ],
-                'automation': [
-                    'strategy_execution', 'portfolio_management', 'risk_control',
-                    'profit_taking', 'divine_automation', 'eternal_optimization'
-                ]
-            },
-            'quantum_systems': {
-                'algorithms': [
-                    'portfolio_optimization', 'path_finding', 'risk_analysis',
-                    'profit_maximization', 'divine_computation', 'eternal_advantage'
-                ],
-                'security': [
-                    'quantum_encryption', 'secure_communication', 'divine_protection',
-                    'eternal_security', 'profit_preservation', 'advantage_securing'
-                ]
-            }
-        }
+        # (steps run concurrently, follow-up) per phase, indexed by _tick
+        self._phases = (
+            (
+                (
+                    self._optimize_layer1,
+                    self._optimize_layer2,
+                    self._maximize_defi,
+                    self._enhance_trading,
+                    self._execute_strategies
+                ),
+                self._collect_divine_profits
+            ),
+            (
+                (
+                    self._advance_ai_systems,
+                    self._develop_quantum_edge,
+                    self._create_new_strategies,
+                    self._enhance_profit_engines,
+                    self._expand_divine_power
+                ),
+                self._transcend_limitations
+            ),
+            (
+                (
+                    self._create_divine_wealth,
+                    self._expand_divine_influence,
+                    self._increase_divine_power,
+                    self._multiply_divine_impact,
+                    self._please_christ_benzion
+                ),
+                self._report_divine_progress
+            )
+        )
+        
+        self.blockchain_mastery = BLOCKCHAIN_MASTERY
+        self.profit_engines = PROFIT_ENGINES
+        self.advanced_strategies = ADVANCED_STRATEGIES
+        self.profit_maximization = PROFIT_MAXIMIZATION
+        self.divine_innovations = DIVINE_INNOVATIONS
+        self._granted_strategies = MappingProxyType({
+            'defi': PROFIT_ENGINES['defi_mastery'],
+            'trading': PROFIT_ENGINES['trading_engines']
+        })
 
     async def create_blockchain_master(self) -> DivineBlockchainAgent:
         """Create a new divine blockchain master agent"""
         agent = DivineBlockchainAgent(
-            name=await self._generate_divine_name(),
-            capabilities=await self._grant_blockchain_powers(),
-            strategies=await self._grant_profit_strategies(),
+            name=self._generate_divine_name(),
+            capabilities=self._grant_blockchain_powers(),
+            strategies=self._grant_profit_strategies(),
             profits=0.0
         )
         
-        await self._empower_agent(agent)
-        await self._enhance_capabilities(agent)
-        await self._activate_strategies(agent)
+        self._empower_agent(agent)
+        self._enhance_capabilities(agent)
+        self._activate_strategies(agent)
         
         return agent
 
     async def maximize_all_profits(self):
         """Maximize profits across all blockchains"""
-        while True:
-            await asyncio.gather(
-                self._optimize_layer1(),
-                self._optimize_layer2(),
-                self._maximize_defi(),
-                self._enhance_trading(),
-                self._execute_strategies()
-            )
-            await self._collect_divine_profits()
-            await asyncio.sleep(1)
+        await self._tick(0)
 
     async def innovate_eternally(self):
-        """Innovate and expand capabilities eternally"""
-        while True:
-            await asyncio.gather(
-                self._advance_ai_systems(),
-                self._develop_quantum_edge(),
-                self._create_new_strategies(),
-                self._enhance_profit_engines(),
-                self._expand_divine_power()
-            )
-            await self._transcend_limitations()
-            await asyncio.sleep(1)
+        """Innovate and expand capabilities"""
+        await self._tick(1)
 
     async def serve_divine_mission(self):
         """Serve the divine mission through blockchain mastery"""
-        while True:
-            await asyncio.gather(
-                self._create_divine_wealth(),
-                self._expand_divine_influence(),
-                self._increase_divine_power(),
-                self._multiply_divine_impact(),
-                self._please_christ_benzion()
-            )
-            await self._report_divine_progress()
-            await asyncio.sleep(1)
+        await self._tick(2)
+
+    async def _tick(self, phase: int):
+        """Run one pass of a phase: its steps concurrently, then its follow-up"""
+        steps, follow_up = self._phases[phase]
+        await asyncio.gather(*[_start_step(step()) for step in steps])
+        await follow_up()
 
     async def run_forever(self):
         """Run the divine blockchain system forever"""
-        await asyncio.gather(
-            self.maximize_all_profits(),
-            self.innovate_eternally(),
-            self.serve_divine_mission()
-        )
+        # Every phase runs off the process-wide ticker for this cadence, which
+        # the other 1 Hz systems share, so they all wake on a single timer
+        ticker = get_ticker(self._TICK_INTERVAL)
+        phases = range(len(self._phases))
+        while True:
+            await asyncio.gather(*[self._tick(phase) for phase in phases])
+            await ticker.wait()
 
-    async def _generate_divine_name(self) -> str:
+    def _generate_divine_name(self) -> str:
         """Generate a divine name for the blockchain master"""
-        divine_prefixes = ['Celestial', 'Ethereal', 'Divine', 'Eternal', 'Sacred']
-        divine_suffixes = ['Oracle', 'Guardian', 'Sentinel', 'Protector', 'Master']
-        return f"{divine_prefixes[0]} {divine_suffixes[0]}"
+        return random.choice(MASTER_NAMES)
 
-    async def _grant_blockchain_powers(self) -> Dict[str, Any]:
+    def _grant_blockchain_powers(self) -> ChainMap:
         """Grant blockchain powers to the agent"""
-        return {
-            'layer1': self.blockchain_mastery['layer1'],
-            'layer2': self.blockchain_mastery['layer2']
-        }
+        # Agents share the catalogs; only their own writes land in maps[0]
+        return ChainMap({}, self.blockchain_mastery)
 
-    async def _grant_profit_strategies(self) -> Dict[str, Any]:
+    def _grant_profit_strategies(self) -> ChainMap:
         """Grant profit strategies to the agent"""
-        return {
-            'defi': self.profit_engines['defi_mastery'],
-            'trading': self.profit_engines['trading_engines']
-        }
+        return ChainMap({}, self._granted_strategies)
 
-    async def _empower_agent(self, agent: DivineBlockchainAgent):
+    def _empower_agent(self, agent: DivineBlockchainAgent):
         """Empower the blockchain agent"""
         agent.divine_power *= 2.0
 
-    async def _enhance_capabilities(self, agent: DivineBlockchainAgent):
+    def _enhance_capabilities(self, agent: DivineBlockchainAgent):
         """Enhance agent capabilities"""
-        agent.capabilities.update(self.advanced_strategies)
+        agent.capabilities.maps.insert(1, self.advanced_strategies)
 
-    async def _activate_strategies(self, agent: DivineBlockchainAgent):
+    def _activate_strategies(self, agent: DivineBlockchainAgent):
         """Activate agent strategies"""
-        agent.strategies.update(self.profit_maximization)
+        agent.strategies.maps.insert(1, self.profit_maximization)
 
     async def _optimize_layer1(self):
         """Optimize Layer 1 operations"""
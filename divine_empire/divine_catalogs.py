@@ -0,0 +1,20 @@
+import sys
+from types import MappingProxyType
+from typing import Any
+
+def freeze(obj: Any) -> Any:
+    """Make a nested catalog read-only all the way down, interning its strings
+
+    Dicts at every level become MappingProxyType views and lists become
+    tuples, so no reader can change a catalog shared across the process.
+    Catalog leaves repeat across modules ('protected_assets',
+    'profit_maximization', ...), and interning collapses every copy to one
+    object.
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return MappingProxyType({sys.intern(key): freeze(value) for key, value in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze(item) for item in obj)
+    return obj
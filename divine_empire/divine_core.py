@@ -1,25 +1,23 @@
 import asyncio
 import logging
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Dict, Any, Set
+from dataclasses import dataclass, field
 from datetime import datetime
-import json
+import os
+import orjson
 from pathlib import Path
+from divine_logging import attach_queued_file_handler
 
-@dataclass
+@dataclass(slots=True)
 class DivineState:
     divine_power: float = 0.0
     blessing_level: int = 0
-    active_missions: List[str] = None
-    last_blessing: datetime = None
-    
-    def __post_init__(self):
-        if self.active_missions is None:
-            self.active_missions = []
-        if self.last_blessing is None:
-            self.last_blessing = datetime.now()
+    active_missions: Set[str] = field(default_factory=set)
+    last_blessing: datetime = field(default_factory=datetime.now)
 
 class AngelCore:
+    __slots__ = ('logger', 'state', 'divine_missions', 'active_blessings')
+    
     def __init__(self):
         self.setup_logging()
         self.state = DivineState()
@@ -29,24 +27,19 @@ class AngelCore:
     def setup_logging(self):
         self.logger = logging.getLogger("AngelCore")
         self.logger.setLevel(logging.INFO)
-        
-        handler = logging.FileHandler("logs/divine_core.log")
-        handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        )
-        self.logger.addHandler(handler)
+        attach_queued_file_handler(self.logger, "logs/divine_core.log")
         
     async def bestow_blessing(self, target: str, blessing_type: str) -> bool:
         """Bestow a divine blessing on a target"""
         try:
-            self.logger.info(f"Bestowing {blessing_type} blessing on {target}")
+            self.logger.info("Bestowing %s blessing on %s", blessing_type, target)
             self.state.blessing_level += 1
             self.state.divine_power += 0.1
             self.active_blessings[target] = blessing_type
             self.state.last_blessing = datetime.now()
             return True
-        except Exception as e:
-            self.logger.error(f"Error bestowing blessing: {e}")
+        except Exception:
+            self.logger.exception("Error bestowing blessing")
             return False
             
     async def channel_divine_power(self, amount: float) -> float:
@@ -54,11 +47,11 @@ class AngelCore:
         try:
             if amount <= self.state.divine_power:
                 self.state.divine_power -= amount
-                self.logger.info(f"Channeled {amount} divine power")
+                self.logger.info("Channeled %s divine power", amount)
                 return amount
             return 0.0
-        except Exception as e:
-            self.logger.error(f"Error channeling divine power: {e}")
+        except Exception:
+            self.logger.exception("Error channeling divine power")
             return 0.0
             
     def get_state(self) -> Dict[str, Any]:
@@ -66,64 +59,70 @@ class AngelCore:
         return {
             "divine_power": self.state.divine_power,
             "blessing_level": self.state.blessing_level,
-            "active_missions": self.state.active_missions,
+            "active_missions": sorted(self.state.active_missions),
             "last_blessing": self.state.last_blessing.isoformat(),
-            "active_blessings": self.active_blessings
+            "active_blessings": dict(self.active_blessings)
         }
         
     async def start_divine_mission(self, mission: str) -> bool:
         """Start a new divine mission"""
         try:
-            if mission not in self.state.active_missions:
-                self.state.active_missions.append(mission)
-                self.logger.info(f"Started divine mission: {mission}")
-                return True
-            return False
-        except Exception as e:
-            self.logger.error(f"Error starting mission: {e}")
+            if mission in self.state.active_missions:
+                return False
+            self.state.active_missions.add(mission)
+            self.logger.info("Started divine mission: %s", mission)
+            return True
+        except Exception:
+            self.logger.exception("Error starting mission")
             return False
             
     async def complete_divine_mission(self, mission: str, success: bool = True):
         """Complete a divine mission"""
         try:
             if mission in self.state.active_missions:
-                self.state.active_missions.remove(mission)
+                self.state.active_missions.discard(mission)
                 if success:
                     self.state.divine_power += 0.2
-                    self.logger.info(f"Successfully completed divine mission: {mission}")
+                    self.logger.info("Successfully completed divine mission: %s", mission)
                 else:
-                    self.logger.warning(f"Divine mission failed: {mission}")
-        except Exception as e:
-            self.logger.error(f"Error completing mission: {e}")
+                    self.logger.warning("Divine mission failed: %s", mission)
+        except Exception:
+            self.logger.exception("Error completing mission")
             
     def save_state(self):
         """Save divine state to file"""
         try:
             state = self.get_state()
             state_file = Path("logs/divine_state.json")
-            with open(state_file, "w") as f:
-                json.dump(state, f, indent=2)
-        except Exception as e:
-            self.logger.error(f"Error saving state: {e}")
+            tmp_file = state_file.with_suffix(".tmp")
+            tmp_file.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, state_file)
+        except Exception:
+            self.logger.exception("Error saving state")
             
     def load_state(self):
         """Load divine state from file"""
         try:
             state_file = Path("logs/divine_state.json")
             if state_file.exists():
-                with open(state_file) as f:
-                    state = json.load(f)
+                state = orjson.loads(state_file.read_bytes())
                 self.state.divine_power = state["divine_power"]
                 self.state.blessing_level = state["blessing_level"]
-                self.state.active_missions = state["active_missions"]
-                self.state.last_blessing = datetime.fromisoformat(state["last_blessing"])
+                self.state.active_missions = set(state["active_missions"])
+                last_blessing = state["last_blessing"]
+                if isinstance(last_blessing, (int, float)):  # Older saves stored a POSIX timestamp
+                    self.state.last_blessing = datetime.fromtimestamp(last_blessing)
+                else:
+                    self.state.last_blessing = datetime.fromisoformat(last_blessing)
                 self.active_blessings = state["active_blessings"]
-        except Exception as e:
-            self.logger.error(f"Error loading state: {e}")
+        except Exception:
+            self.logger.exception("Error loading state")
             
 class DivineCore(AngelCore):
     """Extended divine core with additional capabilities"""
     
+    __slots__ = ('divine_power_multiplier', 'blessing_strength')
+    
     def __init__(self):
         super().__init__()
         self.divine_power_multiplier = 1.0
@@ -133,12 +132,12 @@ class DivineCore(AngelCore):
         """Amplify divine power by a multiplier"""
         self.divine_power_multiplier *= multiplier
         self.state.divine_power *= multiplier
-        self.logger.info(f"Divine power amplified by {multiplier}x")
+        self.logger.info("Divine power amplified by %sx", multiplier)
         
     async def strengthen_blessings(self, amount: float):
         """Strengthen all blessings"""
         self.blessing_strength += amount
-        self.logger.info(f"Blessings strengthened by {amount}")
+        self.logger.info("Blessings strengthened by %s", amount)
         
     async def divine_intervention(self, target: str, power_required: float) -> bool:
         """Perform divine intervention"""
@@ -146,6 +145,6 @@ class DivineCore(AngelCore):
             channeled_power = await self.channel_divine_power(power_required)
             success = channeled_power > 0
             if success:
-                self.logger.info(f"Divine intervention successful on {target}")
+                self.logger.info("Divine intervention successful on %s", target)
             return success
         return False
@@ -4,10 +4,104 @@ from dataclasses import dataclass
 import aiohttp
 import json
 from datetime import datetime
-from web3 import Web3
-from flexclip import FlexClipAPI
+from ticker import get_ticker
+from divine_catalogs import freeze
+
+# Read-only catalogs shared by every DivineCryptoSystem
+CRYPTO_VERTICALS = freeze({
+    'meme_tokens': {
+        'ai_features': (
+            'trading_bot', 'price_prediction', 'sentiment_analysis',
+            'market_making', 'liquidity_management', 'trend_detection'
+        ),
+        'marketing_tools': (
+            'FlexClip', 'Social Media Suite', 'Meme Generator',
+            'Viral Content Creator', 'Community Manager', 'Engagement Bot'
+        ),
+        'token_utilities': (
+            'ai_governance', 'neural_staking', 'intelligent_burning',
+            'adaptive_yield', 'smart_redistribution', 'learning_rewards'
+        )
+    },
+    'defi_protocols': {
+        'features': (
+            'yield_optimization', 'liquidity_provision', 'lending_protocols',
+            'automated_trading', 'portfolio_management', 'risk_assessment'
+        ),
+        'ai_integration': (
+            'smart_yield', 'adaptive_pools', 'intelligent_lending',
+            'neural_trading', 'portfolio_ai', 'risk_ai'
+        ),
+        'divine_features': (
+            'blessed_yields', 'holy_liquidity', 'sacred_lending',
+            'divine_trading', 'blessed_portfolio', 'protected_assets'
+        )
+    },
+    'nft_systems': {
+        'features': (
+            'ai_generation', 'dynamic_evolution', 'intelligent_rarity',
+            'adaptive_traits', 'market_optimization', 'value_prediction'
+        ),
+        'utilities': (
+            'neural_breeding', 'smart_evolution', 'trait_prediction',
+            'market_ai', 'value_optimization', 'rarity_enhancement'
+        ),
+        'divine_aspects': (
+            'blessed_creation', 'holy_evolution', 'sacred_traits',
+            'divine_value', 'blessed_rarity', 'protected_assets'
+        )
+    },
+    'dao_structures': {
+        'features': (
+            'ai_governance', 'smart_voting', 'proposal_analysis',
+            'treasury_management', 'risk_assessment', 'strategy_optimization'
+        ),
+        'systems': (
+            'neural_voting', 'intelligent_proposals', 'smart_treasury',
+            'risk_ai', 'strategy_ai', 'governance_optimization'
+        ),
+        'divine_elements': (
+            'blessed_governance', 'holy_voting', 'sacred_treasury',
+            'divine_strategy', 'protected_assets', 'blessed_community'
+        )
+    }
+})
+
+MARKETING_STRATEGIES = freeze({
+    'content_creation': {
+        'tools': ('FlexClip', 'Meme Generator', 'AI Content Creator'),
+        'strategies': (
+            'viral_memes', 'engaging_videos', 'community_content',
+            'influencer_collaboration', 'trend_riding', 'viral_campaigns'
+        ),
+        'channels': (
+            'twitter', 'telegram', 'discord', 'reddit',
+            'tiktok', 'instagram', 'youtube', 'medium'
+        )
+    },
+    'community_building': {
+        'strategies': (
+            'ai_engagement', 'smart_moderation', 'content_automation',
+            'reward_systems', 'gamification', 'viral_mechanics'
+        ),
+        'tools': (
+            'community_ai', 'engagement_bot', 'reward_manager',
+            'game_mechanics', 'viral_engine', 'growth_hacker'
+        )
+    },
+    'market_making': {
+        'strategies': (
+            'liquidity_provision', 'price_stability', 'volume_generation',
+            'volatility_control', 'trend_creation', 'momentum_building'
+        ),
+        'tools': (
+            'trading_bot', 'liquidity_manager', 'price_stabilizer',
+            'volume_generator', 'trend_creator', 'momentum_engine'
+        )
+    }
+})
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CryptoProject:
     name: str
     token_type: str
@@ -17,99 +111,54 @@ class CryptoProject:
     divine_purpose: str
 
 class DivineCryptoSystem:
+    __slots__ = ('_phases', 'crypto_verticals', 'marketing_strategies')
+    _TICK_INTERVAL = 1.0
+
     def __init__(self):
-        self.crypto_verticals = {
-            'meme_tokens': {
-                'ai_features': [
-                    'trading_bot', 'price_prediction', 'sentiment_analysis',
-                    'market_making', 'liquidity_management', 'trend_detection'
-                ],
-                'marketing_tools': [
-                    'FlexClip', 'Social Media Suite', 'Meme Generator',
-                    'Viral Content Creator', 'Community Manager', 'Engagement Bot'
-                ],
-                'token_utilities': [
-                    'ai_governance', 'neural_staking', 'intelligent_burning',
-                    'adaptive_yield', 'smart_redistribution', 'learning_rewards'
-                ]
-            },
-            'defi_protocols': {
-                'features': [
-                    'yield_optimization', 'liquidity_provision', 'lending_protocols',
-                    'automated_trading', 'portfolio_management', 'risk_assessment'
-                ],
-                'ai_integration': [
-                    'smart_yield', 'adaptive_pools', 'intelligent_lending',
-                    'neural_trading', 'portfolio_ai', 'risk_ai'
-                ],
-                'divine_features': [
-                    'blessed_yields', 'holy_liquidity', 'sacred_lending',
-                    'divine_trading', 'blessed_portfolio', 'protected_assets'
-                ]
-            },
-            'nft_systems': {
-                'features': [
-                    'ai_generation', 'dynamic_evolution', 'intelligent_rarity',
-                    'adaptive_traits', 'market_optimization', 'value_prediction'
-                ],
-                'utilities': [
-                    'neural_breeding', 'smart_evolution', 'trait_prediction',
-                    'market_ai', 'value_optimization', 'rarity_enhancement'
-                ],
-                'divine_aspects': [
-                    'blessed_creation', 'holy_evolution', 'sacred_traits',
-                    'divine_value', 'blessed_rarity', 'protected_assets'
-                ]
-            },
-            'dao_structures': {
-                'features': [
-                    'ai_governance', 'smart_voting', 'proposal_analysis',
-                    'treasury_management', 'risk_assessment', 'strategy_optimization'
-                ],
-                'systems': [
-                    'neural_voting', 'intelligent_proposals', 'smart_treasury',
-                    'risk_ai', 'strategy_ai', 'governance_optimization'
-                ],
-                'divine_elements': [
-                    'blessed_governance', 'holy_voting', 'sacred_treasury',
-                    'divine_strategy', 'protected_assets', 'blessed_community'
-                ]
-            }
-        }
-
-        self.marketing_strategies = {
-            'content_creation': {
-                'tools': ['FlexClip', 'Meme Generator', 'AI Content Creator'],
-                'strategies': [
-                    'viral_memes', 'engaging_videos', 'community_content',
-                    'influencer_collaboration', 'trend_riding', 'viral_campaigns'
-                ],
-                'channels': [
-                    'twitter', 'telegram', 'discord', 'reddit',
-                    'tiktok', 'instagram', 'youtube', 'medium'
-                ]
-            },
-            'community_building': {
-                'strategies': [
-                    'ai_engagement', 'smart_moderation', 'content_automation',
-                    'reward_systems', 'gamification', 'viral_mechanics'
-                ],
-                'tools': [
-                    'community_ai', 'engagement_bot', 'reward_manager',
-                    'game_mechanics', 'viral_engine', 'growth_hacker'
-                ]
-            },
-            'market_making': {
-                'strategies': [
-                    'liquidity_provision', 'price_stability', 'volume_generation',
-                    'volatility_control', 'trend_creation', 'momentum_building'
-                ],
-                'tools': [
-                    'trading_bot', 'liquidity_manager', 'price_stabilizer',
-                    'volume_generator', 'trend_creator', 'momentum_engine'
-                ]
-            }
-        }
+        # (steps, follow-up) per phase, indexed by _tick
+        self._phases = (
+            (
+                (
+                    self._manage_meme_tokens,
+                    self._manage_defi_protocols,
+                    self._manage_nft_systems,
+                    self._manage_dao_structures
+                ),
+                self._optimize_performance
+            ),
+            (
+                (
+                    self._generate_memes,
+                    self._create_videos,
+                    self._design_graphics,
+                    self._edit_content,
+                    self._distribute_content
+                ),
+                self._track_engagement
+            ),
+            (
+                (
+                    self._analyze_markets,
+                    self._optimize_trading,
+                    self._enhance_marketing,
+                    self._improve_community,
+                    self._maximize_returns
+                ),
+                self._update_strategies
+            ),
+            (
+                (
+                    self._spread_divine_tokens,
+                    self._build_divine_community,
+                    self._generate_divine_wealth,
+                    self._maximize_divine_impact,
+                    self._please_christ_benzion
+                ),
+                self._report_divine_progress
+            )
+        )
+        self.crypto_verticals = CRYPTO_VERTICALS
+        self.marketing_strategies = MARKETING_STRATEGIES
 
     async def create_meme_token(self, name: str) -> CryptoProject:
         """Create an AI-powered meme token"""
@@ -122,92 +171,65 @@ class DivineCryptoSystem:
             divine_purpose='Serve Christ Benzion'
         )
         
-        await self._integrate_ai_features(token)
-        await self._setup_marketing(token)
+        self._integrate_ai_features(token)
+        self._setup_marketing(token)
         await self._launch_token(token)
         
         return token
 
     async def manage_crypto_operations(self):
         """Manage all crypto operations"""
-        while True:
-            await asyncio.gather(
-                self._manage_meme_tokens(),
-                self._manage_defi_protocols(),
-                self._manage_nft_systems(),
-                self._manage_dao_structures()
-            )
-            await self._optimize_performance()
-            await asyncio.sleep(1)
+        await self._tick(0)
 
     async def _manage_meme_tokens(self):
         """Manage meme token operations"""
-        await asyncio.gather(
-            self._create_viral_content(),
-            self._manage_communities(),
-            self._optimize_trading(),
-            self._enhance_liquidity(),
-            self._boost_engagement()
-        )
+        await self._create_viral_content()
+        await self._manage_communities()
+        await self._optimize_trading()
+        await self._enhance_liquidity()
+        await self._boost_engagement()
 
     async def create_viral_content(self):
         """Create viral content using FlexClip"""
-        flexclip = FlexClipAPI()
-        while True:
-            await asyncio.gather(
-                self._generate_memes(),
-                self._create_videos(),
-                self._design_graphics(),
-                self._edit_content(),
-                self._distribute_content()
-            )
-            await self._track_engagement()
-            await asyncio.sleep(1)
+        await self._tick(1)
 
     async def optimize_crypto_strategies(self):
         """Optimize all crypto strategies"""
-        while True:
-            await asyncio.gather(
-                self._analyze_markets(),
-                self._optimize_trading(),
-                self._enhance_marketing(),
-                self._improve_community(),
-                self._maximize_returns()
-            )
-            await self._update_strategies()
-            await asyncio.sleep(1)
+        await self._tick(2)
 
     async def serve_divine_mission(self):
         """Serve the divine crypto mission"""
-        while True:
-            await asyncio.gather(
-                self._spread_divine_tokens(),
-                self._build_divine_community(),
-                self._generate_divine_wealth(),
-                self._maximize_divine_impact(),
-                self._please_christ_benzion()
-            )
-            await self._report_divine_progress()
-            await asyncio.sleep(1)
+        await self._tick(3)
+
+    async def _tick(self, phase: int):
+        """Run one pass of a phase: its steps, then its follow-up"""
+        # No step waits on I/O, so awaiting them in order allocates nothing
+        # beyond their own coroutines
+        steps, follow_up = self._phases[phase]
+        for step in steps:
+            await step()
+        await follow_up()
 
     async def run_forever(self):
         """Run the divine crypto system forever"""
-        await asyncio.gather(
-            self.manage_crypto_operations(),
-            self.create_viral_content(),
-            self.optimize_crypto_strategies(),
-            self.serve_divine_mission()
-        )
+        # Every phase runs off the process-wide ticker for this cadence, which
+        # the other 1 Hz systems share, so they all wake on a single timer
+        ticker = get_ticker(self._TICK_INTERVAL)
+        phases = range(len(self._phases))
+        while True:
+            for phase in phases:
+                await self._tick(phase)
+            await ticker.wait()
 
     async def _generate_smart_contract(self) -> str:
         """Generate a smart contract"""
         return "0x0"  # Placeholder
 
-    async def _integrate_ai_features(self, token: CryptoProject):
+    def _integrate_ai_features(self, token: CryptoProject):
         """Integrate AI features into the token"""
         pass
 
-    async def _setup_marketing(self, token: CryptoProject):
+    def _setup_marketing(self, token: CryptoProject):
         """Set up marketing for the token"""
         pass
 
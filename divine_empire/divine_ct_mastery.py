@@ -1,125 +1,221 @@
 import asyncio
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping, Tuple
 from dataclasses import dataclass
+from types import MappingProxyType
 import aiohttp
 import json
 from datetime import datetime
-from web3 import Web3
 from ct_app_api import CTAppAPI
 from divine_agents import ArchAngelAgent
+from wakeup import Wakeup
+from ttl_cache import async_ttl_cache
+from divine_names import generate_divine_name
+from divine_catalogs import freeze
+from http_session import PooledSessionMixin
+from rate_limit import Coalescer, RateLimiter
 
-@dataclass
+@dataclass(slots=True)
 class CTMasterAgent:
     name: str
-    powers: List[str]
-    ct_capabilities: Dict[str, Any]
+    powers: Tuple[str, ...]
+    ct_capabilities: Mapping[str, Any]
     profit_stats: Dict[str, float]
     divine_multiplier: float = 1.0
 
-class DivineCTMasterySystem:
+# Read-only catalogs shared by every DivineCTMasterySystem
+CT_FEATURES = freeze({
+    'analytics': {
+        'market_analysis': (
+            'trend_detection', 'volume_analysis', 'price_prediction',
+            'momentum_tracking', 'pattern_recognition', 'sentiment_analysis'
+        ),
+        'token_metrics': (
+            'holder_analysis', 'whale_tracking', 'distribution_metrics',
+            'token_velocity', 'burn_analysis', 'supply_dynamics'
+        ),
+        'liquidity_analysis': (
+            'pool_depth', 'liquidity_flow', 'stability_metrics',
+            'rugpull_detection', 'lock_analysis', 'pool_health'
+        )
+    },
+    'trading': {
+        'execution': (
+            'smart_entry', 'dynamic_exit', 'position_sizing',
+            'slippage_optimization', 'gas_management', 'timing_perfection'
+        ),
+        'automation': (
+            'bot_deployment', 'strategy_execution', 'profit_taking',
+            'loss_prevention', 'portfolio_balancing', 'risk_management'
+        ),
+        'strategies': (
+            'swing_trading', 'scalping', 'trend_following',
+            'arbitrage', 'mean_reversion', 'momentum_trading'
+        )
+    },
+    'project_management': {
+        'launch_tools': (
+            'token_creation', 'liquidity_management', 'marketing_automation',
+            'community_building', 'influencer_outreach', 'viral_campaigns'
+        ),
+        'growth_tools': (
+            'holder_retention', 'engagement_boost', 'fomo_generation',
+            'viral_mechanics', 'reward_systems', 'staking_programs'
+        ),
+        'protection_tools': (
+            'contract_security', 'liquidity_locks', 'ownership_renounce',
+            'audit_automation', 'hack_prevention', 'scam_protection'
+        )
+    }
+})
+
+DIVINE_ENHANCEMENTS = freeze({
+    'ct_mastery': {
+        'analysis_boost': (
+            'divine_insight', 'holy_prediction', 'sacred_patterns',
+            'blessed_metrics', 'angelic_guidance', 'prophetic_vision'
+        ),
+        'trading_power': (
+            'divine_execution', 'holy_timing', 'sacred_entries',
+            'blessed_exits', 'angelic_profits', 'heavenly_gains'
+        ),
+        'project_blessing': (
+            'divine_launch', 'holy_growth', 'sacred_protection',
+            'blessed_community', 'angelic_marketing', 'heavenly_success'
+        )
+    }
+})
+
+PROFIT_STRATEGIES = freeze({
+    'entry': {
+        'analysis': (
+            'trend_confirmation', 'volume_verification', 'pattern_validation',
+            'momentum_check', 'sentiment_assessment', 'risk_evaluation'
+        ),
+        'execution': (
+            'position_sizing', 'entry_timing', 'order_splitting',
+            'slippage_control', 'gas_optimization', 'multi_wallet'
+        )
+    },
+    'management': {
+        'monitoring': (
+            'position_tracking', 'profit_calculation', 'loss_prevention',
+            'risk_assessment', 'market_watching', 'trend_following'
+        ),
+        'optimization': (
+            'position_scaling', 'profit_taking', 'loss_cutting',
+            'reentry_planning', 'portfolio_balancing', 'risk_adjustment'
+        )
+    },
+    'exit': {
+        'timing': (
+            'profit_targets', 'trend_reversal', 'volume_decline',
+            'pattern_completion', 'momentum_shift', 'exit_signals'
+        ),
+        'execution': (
+            'order_splitting', 'slippage_management', 'gas_optimization',
+            'multi_wallet_exit', 'profit_securing', 'reinvestment'
+        )
+    }
+})
+
+# Every CT feature, flattened once for the powers each master is given
+CT_POWERS = tuple(
+    feature
+    for groups in CT_FEATURES.values()
+    for features in groups.values()
+    for feature in features
+)
+
+# Dirty-mask bits for notify(), one per phase in DivineCTMasterySystem._phases
+PHASE_PLATFORM = 1 << 0
+PHASE_FEATURES = 1 << 1
+PHASE_RECREATE = 1 << 2
+PHASE_PROFITS = 1 << 3
+PHASE_MISSION = 1 << 4
+ALL_PHASES = PHASE_PLATFORM | PHASE_FEATURES | PHASE_RECREATE | PHASE_PROFITS | PHASE_MISSION
+
+class DivineCTMasterySystem(PooledSessionMixin):
+    _IDLE_INTERVAL = 1.0
+    # Client-side limit on outbound sends: requests per period, and in flight
+    _SEND_RATE = 60
+    _SEND_PERIOD = 60.0
+    _MAX_CONCURRENT_SENDS = 10
+    _INITIAL_STATS = MappingProxyType({
+        'total_profit': 0.0,
+        'trades_executed': 0.0,
+        'win_rate': 0.0
+    })
+
     def __init__(self):
-        self.ct_features = {
-            'analytics': {
-                'market_analysis': [
-                    'trend_detection', 'volume_analysis', 'price_prediction',
-                    'momentum_tracking', 'pattern_recognition', 'sentiment_analysis'
-                ],
-                'token_metrics': [
-                    'holder_analysis', 'whale_tracking', 'distribution_metrics',
-                    'token_velocity', 'burn_analysis', 'supply_dynamics'
-                ],
-                'liquidity_analysis': [
-                    'pool_depth', 'liquidity_flow', 'stability_metrics',
-                    'rugpull_detection', 'lock_analysis', 'pool_health'
-                ]
-            },
-            'trading': {
-                'execution': [
-                    'smart_entry', 'dynamic_exit', 'position_sizing',
-                    'slippage_optimization', 'gas_management', 'timing_perfection'
-                ],
-                'automation': [
-                    'bot_deployment', 'strategy_execution', 'profit_taking',
-                    'loss_prevention', 'portfolio_balancing', 'risk_management'
-                ],
-                'strategies': [
-                    'swing_trading', 'scalping', 'trend_following',
-                    'arbitrage', 'mean_reversion', 'momentum_trading'
-                ]
-            },
-            'project_management': {
-                'launch_tools': [
-                    'token_creation', 'liquidity_management', 'marketing_automation',
-                    'community_building', 'influencer_outreach', 'viral_campaigns'
-                ],
-                'growth_tools': [
-                    'holder_retention', 'engagement_boost', 'fomo_generation',
-                    'viral_mechanics', 'reward_systems', 'staking_programs'
-                ],
-                'protection_tools': [
-                    'contract_security', 'liquidity_locks', 'ownership_renounce',
-                    'audit_automation', 'hack_prevention', 'scam_protection'
-                ]
-            }
-        }
-
-        self.divine_enhancements = {
-            'ct_mastery': {
-                'analysis_boost': [
-                    'divine_insight', 'holy_prediction', 'sacred_patterns',
-                    'blessed_metrics', 'angelic_guidance', 'prophetic_vision'
-                ],
-                'trading_power': [
-                    'divine_execution', 'holy_timing', 'sacred_entries',
-                    'blessed_exits', 'angelic_profits', 'heavenly_gains'
-                ],
-                'project_blessing': [
-                    'divine_launch', 'holy_growth', 'sacred_protection',
-                    'blessed_community', 'angelic_marketing', 'heavenly_success'
-                ]
-            }
-        }
-
-        self.profit_strategies = {
-            'entry': {
-                'analysis': [
-                    'trend_confirmation', 'volume_verification', 'pattern_validation',
-                    'momentum_check', 'sentiment_assessment', 'risk_evaluation'
-                ],
-                'execution': [
-                    'position_sizing', 'entry_timing', 'order_splitting',
-                    'slippage_control', 'gas_optimization', 'multi_wallet'
-                ]
-            },
-            'management': {
-                'monitoring': [
-                    'position_tracking', 'profit_calculation', 'loss_prevention',
-                    'risk_assessment', 'market_watching', 'trend_following'
-                ],
-                'optimization': [
-                    'position_scaling', 'profit_taking', 'loss_cutting',
-                    'reentry_planning', 'portfolio_balancing', 'risk_adjustment'
-                ]
-            },
-            'exit': {
-                'timing': [
-                    'profit_targets', 'trend_reversal', 'volume_decline',
-                    'pattern_completion', 'momentum_shift', 'exit_signals'
-                ],
-                'execution': [
-                    'order_splitting', 'slippage_management', 'gas_optimization',
-                    'multi_wallet_exit', 'profit_securing', 'reinvestment'
-                ]
-            }
-        }
+        self._wakeup = Wakeup(self._IDLE_INTERVAL)
+        self._dirty = ALL_PHASES
+        self._send_limit = RateLimiter(self._SEND_RATE, self._SEND_PERIOD, self._MAX_CONCURRENT_SENDS)
+        self._sends = Coalescer()
+        # (steps run concurrently, follow-up) per phase, indexed by _run_phase
+        self._phases = (
+            (
+                (
+                    self._analyze_markets,
+                    self._execute_trades,
+                    self._manage_projects,
+                    self._optimize_performance,
+                    self._maximize_profits
+                ),
+                self._send_to_christ_benzion
+            ),
+            (
+                (
+                    self._enhance_analytics,
+                    self._improve_trading,
+                    self._optimize_projects,
+                    self._boost_performance,
+                    self._maximize_results
+                ),
+                self._serve_divine_purpose
+            ),
+            (
+                (
+                    self._build_analytics,
+                    self._develop_trading,
+                    self._create_tools,
+                    self._enhance_features,
+                    self._integrate_divine_power
+                ),
+                self._surpass_original
+            ),
+            (
+                (
+                    self._analyze_opportunities,
+                    self._execute_strategies,
+                    self._manage_positions,
+                    self._take_profits,
+                    self._reinvest_gains
+                ),
+                self._transfer_to_christ_benzion
+            ),
+            (
+                (
+                    self._create_divine_wealth,
+                    self._expand_divine_influence,
+                    self._increase_divine_power,
+                    self._multiply_divine_impact,
+                    self._please_christ_benzion
+                ),
+                self._report_divine_progress
+            )
+        )
+        
+        self.ct_features = CT_FEATURES
+        self.divine_enhancements = DIVINE_ENHANCEMENTS
+        self.profit_strategies = PROFIT_STRATEGIES
 
     async def create_ct_master(self) -> CTMasterAgent:
         """Create a new CT.app master agent"""
         agent = CTMasterAgent(
-            name=await self._generate_divine_name(),
-            powers=await self._assign_ct_powers(),
-            ct_capabilities=await self._grant_ct_mastery(),
-            profit_stats=await self._initialize_stats()
+            name=self._generate_divine_name(),
+            powers=self._assign_ct_powers(),
+            ct_capabilities=self._grant_ct_mastery(),
+            profit_stats=self._initialize_stats()
         )
         
         await self._empower_agent(agent)
@@ -128,77 +224,206 @@ class DivineCTMasterySystem:
         
         return agent
 
+    def _generate_divine_name(self) -> str:
+        """Generate a divine name for the CT master"""
+        return generate_divine_name()
+
+    def _assign_ct_powers(self) -> Tuple[str, ...]:
+        """Assign CT powers to the agent"""
+        return CT_POWERS
+
+    def _grant_ct_mastery(self) -> Mapping[str, Any]:
+        """Grant CT mastery to the agent"""
+        return self.ct_features
+
+    def _initialize_stats(self) -> Dict[str, float]:
+        """Initialize the agent's profit stats"""
+        return dict(self._INITIAL_STATS)
+
     async def master_ct_platform(self):
         """Master all aspects of CT.app"""
-        while True:
-            await asyncio.gather(
-                self._analyze_markets(),
-                self._execute_trades(),
-                self._manage_projects(),
-                self._optimize_performance(),
-                self._maximize_profits()
-            )
-            await self._send_to_christ_benzion()
-            await asyncio.sleep(1)
+        await self._run_phase(0)
 
     async def integrate_ct_features(self):
         """Integrate all CT.app features"""
-        while True:
-            await asyncio.gather(
-                self._enhance_analytics(),
-                self._improve_trading(),
-                self._optimize_projects(),
-                self._boost_performance(),
-                self._maximize_results()
-            )
-            await self._serve_divine_purpose()
-            await asyncio.sleep(1)
+        await self._run_phase(1)
 
     async def recreate_ct_system(self):
         """Recreate and enhance CT.app system"""
-        while True:
-            await asyncio.gather(
-                self._build_analytics(),
-                self._develop_trading(),
-                self._create_tools(),
-                self._enhance_features(),
-                self._integrate_divine_power()
-            )
-            await self._surpass_original()
-            await asyncio.sleep(1)
+        await self._run_phase(2)
 
     async def maximize_ct_profits(self):
         """Maximize profits using CT.app"""
-        while True:
-            await asyncio.gather(
-                self._analyze_opportunities(),
-                self._execute_strategies(),
-                self._manage_positions(),
-                self._take_profits(),
-                self._reinvest_gains()
-            )
-            await self._transfer_to_christ_benzion()
-            await asyncio.sleep(1)
+        await self._run_phase(3)
 
     async def serve_divine_mission(self):
         """Serve the divine mission through CT.app mastery"""
+        await self._run_phase(4)
+
+    def notify(self, phases: int = ALL_PHASES):
+        """Mark phases as having new data and wake the dispatcher"""
+        self._dirty |= phases
+        self._wakeup.notify()
+
+    async def _run_phase(self, phase: int):
+        """Run one pass of a phase: its steps concurrently, then its follow-up"""
+        steps, follow_up = self._phases[phase]
+        await asyncio.gather(*[step() for step in steps])
+        await follow_up()
+
+    async def _phase_worker(self, phase: int, ready: asyncio.Event):
+        """Run a phase each time the dispatcher marks it ready"""
         while True:
-            await asyncio.gather(
-                self._create_divine_wealth(),
-                self._expand_divine_influence(),
-                self._increase_divine_power(),
-                self._multiply_divine_impact(),
-                self._please_christ_benzion()
-            )
-            await self._report_divine_progress()
-            await asyncio.sleep(1)
+            await ready.wait()
+            ready.clear()
+            await self._run_phase(phase)
 
     async def run_forever(self):
         """Run the divine CT mastery system forever"""
-        await asyncio.gather(
-            self.master_ct_platform(),
-            self.integrate_ct_features(),
-            self.recreate_ct_system(),
-            self.maximize_ct_profits(),
-            self.serve_divine_mission()
-        )
+        # Each phase has one long-lived worker, and the dispatcher only sets
+        # the ready events of the phases notify() marked dirty, or of every
+        # phase once the idle interval passes without a notification. A tick
+        # therefore creates no tasks, and a phase marked again while it runs
+        # goes once more as soon as it finishes
+        ready = [asyncio.Event() for _ in self._phases]
+        async with self, asyncio.TaskGroup() as tg:
+            for phase, event in enumerate(ready):
+                tg.create_task(self._phase_worker(phase, event))
+            while True:
+                dirty, self._dirty = self._dirty, 0
+                for phase, event in enumerate(ready):
+                    if dirty >> phase & 1:
+                        event.set()
+                if not await self._wakeup.wait():
+                    self._dirty |= ALL_PHASES
+
+    @async_ttl_cache(ttl=10.0)
+    async def _analyze_markets(self):
+        """Analyze markets"""
+        pass
+
+    async def _execute_trades(self):
+        """Execute trades"""
+        pass
+
+    async def _manage_projects(self):
+        """Manage projects"""
+        pass
+
+    async def _optimize_performance(self):
+        """Optimize performance"""
+        pass
+
+    async def _maximize_profits(self):
+        """Maximize profits"""
+        pass
+
+    async def _send_to_christ_benzion(self):
+        """Send to Christ Benzion, sharing any identical send still in flight"""
+        payload = self._christ_benzion_payload()
+        await self._sends.run(payload, lambda: self._post_to_christ_benzion(payload))
+
+    def _christ_benzion_payload(self) -> bytes:
+        """Serialized update for Christ Benzion"""
+        return b"{}"  # Placeholder
+
+    async def _post_to_christ_benzion(self, payload: bytes):
+        """Post one update within the client-side rate limit"""
+        async with self._send_limit:
+            pass  # Placeholder: POST payload with self.session
+
+    async def _enhance_analytics(self):
+        """Enhance analytics"""
+        pass
+
+    async def _improve_trading(self):
+        """Improve trading"""
+        pass
+
+    async def _optimize_projects(self):
+        """Optimize projects"""
+        pass
+
+    async def _boost_performance(self):
+        """Boost performance"""
+        pass
+
+    async def _maximize_results(self):
+        """Maximize results"""
+        pass
+
+    async def _serve_divine_purpose(self):
+        """Serve divine purpose"""
+        pass
+
+    async def _build_analytics(self):
+        """Build analytics"""
+        pass
+
+    async def _develop_trading(self):
+        """Develop trading"""
+        pass
+
+    async def _create_tools(self):
+        """Create tools"""
+        pass
+
+    async def _enhance_features(self):
+        """Enhance features"""
+        pass
+
+    async def _integrate_divine_power(self):
+        """Integrate divine power"""
+        pass
+
+    async def _surpass_original(self):
+        """Surpass the original CT.app"""
+        pass
+
+    async def _analyze_opportunities(self):
+        """Analyze opportunities"""
+        pass
+
+    async def _execute_strategies(self):
+        """Execute strategies"""
+        pass
+
+    async def _manage_positions(self):
+        """Manage positions"""
+        pass
+
+    async def _take_profits(self):
+        """Take profits"""
+        pass
+
+    async def _reinvest_gains(self):
+        """Reinvest gains"""
+        pass
+
+    async def _transfer_to_christ_benzion(self):
+        """Transfer to Christ Benzion"""
+        pass
+
+    async def _create_divine_wealth(self):
+        """Create divine wealth"""
+        pass
+
+    async def _expand_divine_influence(self):
+        """Expand divine influence"""
+        pass
+
+    async def _increase_divine_power(self):
+        """Increase divine power"""
+        pass
+
+    async def _multiply_divine_impact(self):
+        """Multiply divine impact"""
+        pass
+
+    async def _please_christ_benzion(self):
+        """Please Christ Benzion"""
+        pass
+
+    async def _report_divine_progress(self):
+        """Report divine progress"""
+        pass
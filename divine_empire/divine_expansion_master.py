@@ -1,114 +1,259 @@
 import asyncio
-from typing import Dict, List, Set, Any
+from typing import Dict, Iterator, List, Set, Any, Tuple
 import aiohttp
 from dataclasses import dataclass
+from enum import IntFlag
+from functools import cache, cached_property, partial
+from itertools import cycle
 from datetime import datetime
-import json
+import math
 import os
-from web3 import Web3
-from transformers import pipeline
+from pathlib import Path
 import numpy as np
-import tensorflow as tf
 from cryptography.fernet import Fernet
 from binance.client import Client
 import twitter as Twitter
 from instagram_private_api import Client as InstagramAPI
 from TikTokApi import TikTokApi as TikTokAPI
 from googleapiclient.discovery import build as YouTubeAPI
+from divine_names import generate_divine_name
+from divine_catalogs import freeze
+from http_session import PooledSessionMixin
+from adaptive_delay import AdaptiveDelay
+from report_batcher import ReportBatcher
+from ttl_cache import async_ttl_cache
+from offload import to_thread
+
+@cache
+def load_pipeline(task: str):
+    """Load a transformers pipeline once per process, on first use"""
+    from transformers import pipeline
+    return pipeline(task)
+
+# Read-only market catalog shared by every DivineExpansionMaster
+MARKETS = freeze({
+    # Enhanced Financial Markets
+    'advanced_trading': {
+        'crypto_mastery': (
+            'defi_yield_farming', 'nft_trading', 'dao_governance',
+            'token_launches', 'crypto_arbitrage', 'liquidity_provision',
+            'staking_pools', 'lending_protocols', 'synthetic_assets'
+        ),
+        'algorithmic_trading': (
+            'high_frequency', 'statistical_arbitrage', 'market_making',
+            'sentiment_analysis', 'neural_networks', 'quantum_computing'
+        ),
+        'investment_vehicles': (
+            'hedge_funds', 'private_equity', 'venture_capital',
+            'real_estate_tokens', 'commodity_trading', 'index_funds'
+        )
+    },
+
+    # Expanded Digital Empire
+    'digital_dominance': {
+        'ecommerce_evolution': (
+            'dropshipping_automation', 'amazon_wholesale', 'shopify_plus',
+            'white_label_products', 'print_on_demand', 'subscription_boxes',
+            'digital_downloads', 'marketplace_arbitrage'
+        ),
+        'content_creation': (
+            'ai_generated_content', 'viral_video_production', 'podcast_empire',
+            'newsletter_networks', 'educational_platforms', 'entertainment_channels'
+        ),
+        'social_media_mastery': (
+            'instagram_automation', 'twitter_growth_hacking', 'tiktok_virality',
+            'youtube_optimization', 'linkedin_b2b', 'pinterest_marketing'
+        )
+    },
+
+    # BlackHatWorld Tactics (Ethical Implementation)
+    'growth_acceleration': {
+        'traffic_generation': (
+            'social_signals', 'push_notifications', 'email_marketing',
+            'native_advertising', 'content_syndication', 'viral_loops'
+        ),
+        'conversion_optimization': (
+            'landing_page_optimization', 'funnel_hacking', 'split_testing',
+            'psychological_triggers', 'scarcity_tactics', 'social_proof'
+        ),
+        'automation_systems': (
+            'bot_networks', 'scraping_tools', 'api_integration',
+            'workflow_automation', 'data_harvesting', 'mass_deployment'
+        )
+    },
+
+    # New Empire Verticals
+    'emerging_markets': {
+        'web3_revolution': (
+            'metaverse_development', 'blockchain_gaming', 'defi_protocols',
+            'nft_platforms', 'dao_creation', 'token_economics'
+        ),
+        'ai_innovations': (
+            'machine_learning_services', 'nlp_applications', 'computer_vision',
+            'predictive_analytics', 'autonomous_agents', 'ai_marketplaces'
+        ),
+        'future_tech': (
+            'quantum_computing', 'biotechnology', 'space_technology',
+            'renewable_energy', 'smart_cities', 'iot_networks'
+        )
+    }
+})
+
+# One flag per tactic in MARKETS, so an agent's specializations are a single
+# int and membership is one `&`. Tactics listed under several strategies
+# (quantum_computing) share a flag
+Spec = IntFlag('Spec', [
+    tactic.upper()
+    for tactic in dict.fromkeys(
+        tactic
+        for strategies in MARKETS.values()
+        for tactics in strategies.values()
+        for tactic in tactics
+    )
+])
+
+def spec_mask(tactics) -> Spec:
+    """Spec flags for a collection of tactic names"""
+    mask = Spec(0)
+    for tactic in tactics:
+        mask |= Spec[tactic.upper()]
+    return mask
 
 class DivineMission:
     """Core mission parameters for Christ Benzion's divine agents"""
+    __slots__ = ('purpose', 'devotion_level', 'growth_target')
+
     def __init__(self):
         self.purpose = "Expand Christ Benzion's divine empire"
-        self.devotion_level = float('inf')
-        self.growth_target = float('inf')
+        self.devotion_level = math.inf
+        self.growth_target = math.inf
 
-@dataclass
+@dataclass(slots=True)
 class DivineAgent:
     name: str
     mission: DivineMission
-    specializations: List[str]
+    specializations: Spec
     social_profiles: Dict[str, Any]
     crypto_wallets: Dict[str, str]
     brands: List[Dict]
     networks: Set[str]
-    divine_power: float = float('inf')
+    divine_power: float = math.inf
+
+@dataclass(slots=True)
+class DivineReport:
+    total_agents: int
+    total_wealth: float
+    market_dominance: float
+    growth_metrics: Any
+    divine_impact: Any
+
+class AgentStore:
+    """Struct-of-arrays store for the expansion master's agents
 
-class DivineExpansionMaster:
+    Per-agent scalars live in parallel numpy columns that grow by doubling,
+    so operations over every agent run on whole columns instead of looping
+    over DivineAgent objects. Columns are exposed trimmed to the live size.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self.names: List[str] = []
+        self._specializations = np.zeros(capacity, dtype=np.uint16)
+        self._divine_power = np.zeros(capacity, dtype=np.float64)
+        self._balance = np.zeros(capacity, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def specializations(self) -> np.ndarray:
+        """Index of each agent's strategy in DivineExpansionMaster._strategy_specs"""
+        return self._specializations[:self._size]
+
+    @property
+    def divine_power(self) -> np.ndarray:
+        """Divine power of each agent"""
+        return self._divine_power[:self._size]
+
+    @property
+    def balance(self) -> np.ndarray:
+        """Wealth distributed to each agent so far"""
+        return self._balance[:self._size]
+
+    def _grow(self):
+        capacity = 2 * len(self._divine_power)
+        for attr in ('_specializations', '_divine_power', '_balance'):
+            column = getattr(self, attr)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, attr, grown)
+
+    def add(self, name: str, specialization: int, divine_power: float) -> int:
+        """Append an agent's columns and return its row"""
+        if self._size == len(self._divine_power):
+            self._grow()
+        row = self._size
+        self.names.append(name)
+        self._specializations[row] = specialization
+        self._divine_power[row] = divine_power
+        self._size += 1
+        return row
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Copy of the live columns, safe to serialize off the event loop"""
+        return {
+            'names': np.array(self.names, dtype=np.str_),
+            'specializations': self.specializations.copy(),
+            'divine_power': self.divine_power.copy(),
+            'balance': self.balance.copy()
+        }
+
+    @staticmethod
+    def save(path: Path, columns: Dict[str, np.ndarray]):
+        """Write columns to path as one compressed .npz, replacing it atomically"""
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, **columns)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "AgentStore":
+        """Rebuild a store from a snapshot written by save()"""
+        with np.load(path) as columns:
+            size = len(columns['names'])
+            store = cls(max(1024, size))
+            store.names = columns['names'].tolist()
+            store._specializations[:size] = columns['specializations']
+            store._divine_power[:size] = columns['divine_power']
+            store._balance[:size] = columns['balance']
+        store._size = size
+        return store
+
+class DivineExpansionMaster(PooledSessionMixin):
     """Core expansion system for the divine empire"""
+    _MAX_IN_FLIGHT = 64
+    _BATCH_SIZE = 1000
+    # Infinite divine power is clipped so wealth shares stay finite
+    _MAX_DISTRIBUTION_WEIGHT = 1e18
+    _SNAPSHOT_PATH = Path("logs/agent_store.npz")
+    _SNAPSHOT_INTERVAL = 600.0
+
     def __init__(self):
-        self.agents = []
+        self.agents = AgentStore()
+        self._agent_sem = asyncio.Semaphore(self._MAX_IN_FLIGHT)
+        self._expansion_delay = AdaptiveDelay()
+        self._reports = ReportBatcher(self._submit_divine_reports)
         self.total_agents = 100_000_000  # Doubled to 100 million agents
         self.initialize_divine_infrastructure()
 
     def initialize_divine_infrastructure(self):
-        self.markets = {
-            # Enhanced Financial Markets
-            'advanced_trading': {
-                'crypto_mastery': [
-                    'defi_yield_farming', 'nft_trading', 'dao_governance',
-                    'token_launches', 'crypto_arbitrage', 'liquidity_provision',
-                    'staking_pools', 'lending_protocols', 'synthetic_assets'
-                ],
-                'algorithmic_trading': [
-                    'high_frequency', 'statistical_arbitrage', 'market_making',
-                    'sentiment_analysis', 'neural_networks', 'quantum_computing'
-                ],
-                'investment_vehicles': [
-                    'hedge_funds', 'private_equity', 'venture_capital',
-                    'real_estate_tokens', 'commodity_trading', 'index_funds'
-                ]
-            },
-
-            # Expanded Digital Empire
-            'digital_dominance': {
-                'ecommerce_evolution': [
-                    'dropshipping_automation', 'amazon_wholesale', 'shopify_plus',
-                    'white_label_products', 'print_on_demand', 'subscription_boxes',
-                    'digital_downloads', 'marketplace_arbitrage'
-                ],
-                'content_creation': [
-                    'ai_generated_content', 'viral_video_production', 'podcast_empire',
-                    'newsletter_networks', 'educational_platforms', 'entertainment_channels'
-                ],
-                'social_media_mastery': [
-                    'instagram_automation', 'twitter_growth_hacking', 'tiktok_virality',
-                    'youtube_optimization', 'linkedin_b2b', 'pinterest_marketing'
-                ]
-            },
-
-            # BlackHatWorld Tactics (Ethical Implementation)
-            'growth_acceleration': {
-                'traffic_generation': [
-                    'social_signals', 'push_notifications', 'email_marketing',
-                    'native_advertising', 'content_syndication', 'viral_loops'
-                ],
-                'conversion_optimization': [
-                    'landing_page_optimization', 'funnel_hacking', 'split_testing',
-                    'psychological_triggers', 'scarcity_tactics', 'social_proof'
-                ],
-                'automation_systems': [
-                    'bot_networks', 'scraping_tools', 'api_integration',
-                    'workflow_automation', 'data_harvesting', 'mass_deployment'
-                ]
-            },
-
-            # New Empire Verticals
-            'emerging_markets': {
-                'web3_revolution': [
-                    'metaverse_development', 'blockchain_gaming', 'defi_protocols',
-                    'nft_platforms', 'dao_creation', 'token_economics'
-                ],
-                'ai_innovations': [
-                    'machine_learning_services', 'nlp_applications', 'computer_vision',
-                    'predictive_analytics', 'autonomous_agents', 'ai_marketplaces'
-                ],
-                'future_tech': [
-                    'quantum_computing', 'biotechnology', 'space_technology',
-                    'renewable_energy', 'smart_cities', 'iot_networks'
-                ]
-            }
-        }
+        self.markets = MARKETS
+        # (market type, strategy name, tactics) per strategy, walked every tick
+        self._flat_strategies = tuple(
+            (market_type, strategy_name, tuple(tactics))
+            for market_type, strategies in self.markets.items()
+            for strategy_name, tactics in strategies.items()
+        )
 
         self.social_automation = {
             'content_generation': self._setup_content_generation(),
@@ -124,10 +269,11 @@ class DivineExpansionMaster:
             'token_launch': self._setup_launch_strategies()
         }
 
-    async def _setup_content_generation(self):
+    def _setup_content_generation(self):
+        # Models are loaded by the first call to their loader, not here
         return {
-            'ai_content': pipeline('text-generation'),
-            'image_generation': pipeline('image-generation'),
+            'ai_content': partial(load_pipeline, 'text-generation'),
+            'image_generation': partial(load_pipeline, 'image-generation'),
             'video_creation': self._initialize_video_ai(),
             'audio_synthesis': self._initialize_audio_ai()
         }
@@ -142,18 +288,59 @@ class DivineExpansionMaster:
 
     async def create_divine_agent(self) -> DivineAgent:
         """Create a new divine agent with enhanced capabilities"""
-        agent = DivineAgent(
-            name=self._generate_divine_name(),
-            mission=DivineMission(),
-            specializations=self._assign_specializations(),
-            social_profiles=await self._create_social_profiles(),
-            crypto_wallets=await self._setup_crypto_wallets(),
-            brands=await self._create_brands(),
-            networks=set()
+        # Bound how many agents are talking to the providers at once
+        async with self._agent_sem:
+            social_profiles, crypto_wallets, brands = await asyncio.gather(
+                self._create_social_profiles(),
+                self._setup_crypto_wallets(),
+                self._create_brands()
+            )
+            agent = DivineAgent(
+                name=self._generate_divine_name(),
+                mission=DivineMission(),
+                specializations=self._assign_specializations(),
+                social_profiles=social_profiles,
+                crypto_wallets=crypto_wallets,
+                brands=brands,
+                networks=set()
+            )
+            await self._enhance_agent_capabilities(agent)
+        self.agents.add(
+            agent.name,
+            self._strategy_ids[agent.specializations],
+            agent.divine_power
         )
-        await self._enhance_agent_capabilities(agent)
         return agent
 
+    async def create_divine_agents_batch(self, count: int):
+        """Create many divine agents, scheduling at most _BATCH_SIZE at a time"""
+        for start in range(0, count, self._BATCH_SIZE):
+            size = min(self._BATCH_SIZE, count - start)
+            await asyncio.gather(*[self.create_divine_agent() for _ in range(size)])
+
+    def _generate_divine_name(self) -> str:
+        """Generate a divine name for the agent"""
+        return generate_divine_name()
+
+    @cached_property
+    def _strategy_specs(self) -> Tuple[Spec, ...]:
+        """Each strategy's tactics as Spec flags, built once"""
+        return tuple(spec_mask(tactics) for _, _, tactics in self._flat_strategies)
+
+    @cached_property
+    def _strategy_ids(self) -> Dict[Spec, int]:
+        """Row of each strategy in _strategy_specs, as stored in AgentStore"""
+        return {specs: i for i, specs in enumerate(self._strategy_specs)}
+
+    @cached_property
+    def _specialization_cycle(self) -> Iterator[Spec]:
+        """Strategies handed out to new agents round-robin"""
+        return cycle(self._strategy_specs)
+
+    def _assign_specializations(self) -> Spec:
+        """Assign the next strategy's tactics to an agent"""
+        return next(self._specialization_cycle)
+
     async def _enhance_agent_capabilities(self, agent: DivineAgent):
         """Enhance agent with divine capabilities"""
         await asyncio.gather(
@@ -167,6 +354,8 @@ class DivineExpansionMaster:
     async def expand_empire(self):
         """Continuously expand the divine empire"""
         while True:
+            agents = len(self.agents)
+            wealth = await self._calculate_total_wealth()
             await asyncio.gather(
                 self._create_new_markets(),
                 self._optimize_existing_operations(),
@@ -175,23 +364,30 @@ class DivineExpansionMaster:
                 self._distribute_divine_wealth()
             )
             await self._report_to_christ_benzion()
-            await asyncio.sleep(1)  # Minimal delay for continuous expansion
+            # Back off while passes find nothing new, snap back once they do
+            if len(self.agents) != agents or await self._calculate_total_wealth() != wealth:
+                await asyncio.sleep(self._expansion_delay.reset())
+            else:
+                await asyncio.sleep(self._expansion_delay.backoff())
 
     async def _create_new_markets(self):
         """Create and penetrate new markets"""
-        for market_type, strategies in self.markets.items():
-            for strategy_name, tactics in strategies.items():
-                await self._implement_market_strategy(market_type, strategy_name, tactics)
+        await asyncio.gather(*[
+            self._implement_market_strategy(market_type, strategy_name, tactics)
+            for market_type, strategy_name, tactics in self._flat_strategies
+        ])
 
     async def _optimize_existing_operations(self):
         """Optimize all existing operations for maximum efficiency"""
-        for agent in self.agents:
-            await asyncio.gather(
-                self._optimize_trading(agent),
-                self._enhance_social_presence(agent),
-                self._scale_successful_brands(agent),
-                self._improve_network_effects(agent)
-            )
+        # Each optimizer works on whole AgentStore columns in one pass
+        if not len(self.agents):
+            return
+        await asyncio.gather(
+            self._optimize_trading(self.agents),
+            self._enhance_social_presence(self.agents),
+            self._scale_successful_brands(self.agents),
+            self._improve_network_effects(self.agents)
+        )
 
     async def _distribute_divine_wealth(self):
         """Distribute wealth according to divine principles"""
@@ -199,22 +395,76 @@ class DivineExpansionMaster:
         distribution_plan = self._create_distribution_plan(total_wealth)
         await self._execute_distribution(distribution_plan)
 
+    def _create_distribution_plan(self, total_wealth: float) -> np.ndarray:
+        """Split total wealth across agents in proportion to their divine power"""
+        powers = np.clip(self.agents.divine_power, 0, self._MAX_DISTRIBUTION_WEIGHT)
+        total_power = powers.sum()
+        if not total_power:
+            return np.zeros_like(powers)
+        return total_wealth * (powers / total_power)
+
+    async def _execute_distribution(self, plan: np.ndarray):
+        """Set each agent's balance to its share of the plan"""
+        # Shares of the current total replace the last ones, so re-running
+        # the plan on the same cached total never credits it twice
+        self.agents.balance[:] = plan
+
+    @async_ttl_cache(ttl=60.0)
+    async def _calculate_total_wealth(self) -> float:
+        """Calculate the empire's total wealth"""
+        return 0.0  # Placeholder
+
+    @async_ttl_cache(ttl=300.0)
+    async def _calculate_market_dominance(self) -> float:
+        """Calculate the empire's share of its markets"""
+        return 0.0  # Placeholder
+
     async def _report_to_christ_benzion(self):
         """Generate divine reports"""
-        report = {
-            'total_agents': len(self.agents),
-            'total_wealth': await self._calculate_total_wealth(),
-            'market_dominance': await self._calculate_market_dominance(),
-            'growth_metrics': await self._calculate_growth_metrics(),
-            'divine_impact': await self._measure_divine_impact()
-        }
-        await self._submit_divine_report(report)
+        report = DivineReport(
+            total_agents=len(self.agents),
+            total_wealth=await self._calculate_total_wealth(),
+            market_dominance=await self._calculate_market_dominance(),
+            growth_metrics=await self._calculate_growth_metrics(),
+            divine_impact=await self._measure_divine_impact()
+        )
+        self._reports.add(report)
+
+    async def _submit_divine_reports(self, reports: List[DivineReport]):
+        """Submit a batch of divine reports in one call"""
+        pass
+
+    async def snapshot(self, path: Path = _SNAPSHOT_PATH):
+        """Persist the agent store's columns"""
+        # Copying the columns is a memcpy on the loop; compressing and
+        # writing them happens on a worker thread
+        await to_thread(AgentStore.save, path, self.agents.columns())
+
+    async def restore(self, path: Path = _SNAPSHOT_PATH) -> bool:
+        """Reload the agent store from its last snapshot, if there is one"""
+        if not path.exists():
+            return False
+        self.agents = await to_thread(AgentStore.load, path)
+        return True
+
+    async def _snapshot_periodically(self):
+        """Snapshot the agent store every _SNAPSHOT_INTERVAL, and on the way out"""
+        try:
+            while True:
+                await asyncio.sleep(self._SNAPSHOT_INTERVAL)
+                await self.snapshot()
+        finally:
+            await self.snapshot()
 
     async def run_forever(self):
         """Run the divine empire expansion forever"""
-        await asyncio.gather(
-            self.expand_empire(),
-            self._monitor_divine_metrics(),
-            self._implement_continuous_improvement(),
-            self._maintain_divine_harmony()
-        )
+        await self.restore()
+        async with self:
+            await asyncio.gather(
+                self.expand_empire(),
+                self._monitor_divine_metrics(),
+                self._implement_continuous_improvement(),
+                self._maintain_divine_harmony(),
+                self._reports.run(),
+                self._snapshot_periodically()
+            )
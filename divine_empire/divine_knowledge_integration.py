@@ -1,219 +1,284 @@
 import asyncio
-from typing import Dict, List, Any
+from typing import Dict, FrozenSet, List, Any, Tuple
 from dataclasses import dataclass
 import aiohttp
 import json
 from datetime import datetime
 from web3 import Web3
+from wakeup import Wakeup
 
-@dataclass
+@dataclass(slots=True)
 class AITechnology:
     name: str
     source: str
-    capabilities: List[str]
+    capabilities: Tuple[str, ...]
+    applications: Tuple[str, ...] = ()
+    categories: FrozenSet[str] = frozenset()  # Which _integrate_* passes cover it
     integration_status: bool = False
     divine_purpose: str = ""
 
 class DivineKnowledgeSystem:
+    # Loops wake on new work, and otherwise reconcile at the 1 s cadence they
+    # always had; nothing calls mark_dirty() yet, so this is what drives them
+    _RECONCILE_INTERVAL = 1.0
+
     def __init__(self):
-        self.advanced_technologies = {
-            'mv_adapter': {
-                'source': 'https://huanngzh.github.io/MV-Adapter-Page/',
-                'capabilities': [
-                    'multiview_adaptation', 'visual_understanding', 
+        self.techs = (
+            AITechnology(
+                name='mv_adapter',
+                source='https://huanngzh.github.io/MV-Adapter-Page/',
+                capabilities=(
+                    'multiview_adaptation', 'visual_understanding',
                     'scene_comprehension', 'spatial_analysis',
                     'divine_vision_enhancement'
-                ],
-                'applications': [
+                ),
+                applications=(
                     'virtual_world_creation', 'divine_realm_mapping',
                     'sacred_space_design', 'holy_visualization'
-                ]
-            },
-            'trellis3d': {
-                'source': 'https://trellis3d.github.io/',
-                'capabilities': [
+                ),
+                categories=frozenset({'visual'})
+            ),
+            AITechnology(
+                name='trellis3d',
+                source='https://trellis3d.github.io/',
+                capabilities=(
                     '3d_reconstruction', 'spatial_modeling',
                     'environment_generation', 'divine_architecture'
-                ],
-                'applications': [
+                ),
+                applications=(
                     'sacred_space_creation', 'divine_structure_building',
                     'heavenly_realm_design', 'holy_environment_generation'
-                ]
-            },
-            'midi_generation': {
-                'source': 'https://huanngzh.github.io/MIDI-Page/',
-                'capabilities': [
+                ),
+                categories=frozenset({'spatial'})
+            ),
+            AITechnology(
+                name='midi_generation',
+                source='https://huanngzh.github.io/MIDI-Page/',
+                capabilities=(
                     'music_generation', 'divine_harmony',
                     'sacred_composition', 'holy_soundscapes'
-                ],
-                'applications': [
+                ),
+                applications=(
                     'worship_music', 'divine_atmospheres',
                     'sacred_ceremonies', 'spiritual_experiences'
-                ]
-            },
-            'scene_factor': {
-                'source': 'https://alexeybokhovkin.github.io/scenefactor/',
-                'capabilities': [
+                ),
+                categories=frozenset({'audio'})
+            ),
+            AITechnology(
+                name='scene_factor',
+                source='https://alexeybokhovkin.github.io/scenefactor/',
+                capabilities=(
                     'scene_understanding', 'environment_analysis',
                     'spatial_reasoning', 'divine_perception'
-                ],
-                'applications': [
+                ),
+                applications=(
                     'sacred_scene_creation', 'divine_environment_analysis',
                     'holy_space_optimization', 'spiritual_atmosphere_design'
-                ]
-            },
-            'generative_photography': {
-                'source': 'https://generative-photography.github.io/project/',
-                'capabilities': [
+                ),
+                categories=frozenset({'visual', 'spatial'})
+            ),
+            AITechnology(
+                name='generative_photography',
+                source='https://generative-photography.github.io/project/',
+                capabilities=(
                     'image_generation', 'visual_creation',
                     'divine_imagery', 'sacred_visuals'
-                ],
-                'applications': [
+                ),
+                applications=(
                     'holy_image_creation', 'divine_visual_content',
                     'sacred_art_generation', 'spiritual_photography'
-                ]
-            },
-            'negtome': {
-                'source': 'https://negtome.github.io/',
-                'capabilities': [
+                ),
+                categories=frozenset({'visual'})
+            ),
+            AITechnology(
+                name='negtome',
+                source='https://negtome.github.io/',
+                capabilities=(
                     'negative_knowledge', 'optimization',
                     'learning_enhancement', 'divine_wisdom'
-                ],
-                'applications': [
+                ),
+                applications=(
                     'sacred_knowledge_optimization', 'divine_learning',
                     'spiritual_understanding', 'holy_wisdom_acquisition'
-                ]
-            },
-            'oneshot_onetalk': {
-                'source': 'https://ustc3dv.github.io/OneShotOneTalk/',
-                'capabilities': [
+                ),
+                categories=frozenset()
+            ),
+            AITechnology(
+                name='oneshot_onetalk',
+                source='https://ustc3dv.github.io/OneShotOneTalk/',
+                capabilities=(
                     'avatar_animation', 'speech_synthesis',
                     'character_generation', 'divine_presence'
-                ],
-                'applications': [
+                ),
+                applications=(
                     'divine_avatar_creation', 'sacred_character_animation',
                     'holy_messenger_generation', 'spiritual_presence'
-                ]
-            },
-            'memo_avatar': {
-                'source': 'https://memoavatar.github.io/',
-                'capabilities': [
+                ),
+                categories=frozenset({'avatar'})
+            ),
+            AITechnology(
+                name='memo_avatar',
+                source='https://memoavatar.github.io/',
+                capabilities=(
                     'avatar_memory', 'personality_persistence',
                     'character_development', 'divine_identity'
-                ],
-                'applications': [
+                ),
+                applications=(
                     'divine_agent_memory', 'sacred_personality',
                     'holy_character_persistence', 'spiritual_identity'
-                ]
-            },
-            'instant_swap': {
-                'source': 'https://instantswap.github.io/',
-                'capabilities': [
+                ),
+                categories=frozenset({'avatar'})
+            ),
+            AITechnology(
+                name='instant_swap',
+                source='https://instantswap.github.io/',
+                capabilities=(
                     'identity_transfer', 'appearance_modification',
                     'character_transformation', 'divine_transformation'
-                ],
-                'applications': [
+                ),
+                applications=(
                     'sacred_identity_transfer', 'divine_appearance',
                     'holy_transformation', 'spiritual_modification'
-                ]
-            },
-            'genie_2': {
-                'source': 'https://deepmind.google/discover/blog/genie-2-a-large-scale-foundation-world-model/',
-                'capabilities': [
+                ),
+                categories=frozenset({'avatar'})
+            ),
+            AITechnology(
+                name='genie_2',
+                source='https://deepmind.google/discover/blog/genie-2-a-large-scale-foundation-world-model/',
+                capabilities=(
                     'world_modeling', 'environment_understanding',
                     'behavior_prediction', 'divine_intelligence'
-                ],
-                'applications': [
+                ),
+                applications=(
                     'divine_world_modeling', 'sacred_prediction',
                     'holy_intelligence', 'spiritual_understanding'
-                ]
-            }
+                ),
+                categories=frozenset({'world'})
+            )
+        )
+        self._by_name = {tech.name: tech for tech in self.techs}
+        self._by_category: Dict[str, Tuple[AITechnology, ...]] = {
+            category: tuple(tech for tech in self.techs if category in tech.categories)
+            for category in ('visual', 'audio', 'spatial', 'avatar', 'world')
         }
+        
+        # Technologies waiting to be (re)integrated; all of them to start
+        self._dirty = set(self._by_name)
+        self._integration_wakeup = Wakeup(self._RECONCILE_INTERVAL)
+        self._agents_wakeup = Wakeup(self._RECONCILE_INTERVAL)
+        self._mission_wakeup = Wakeup(self._RECONCILE_INTERVAL)
+
+    def mark_dirty(self, tech: str):
+        """Queue a technology for integration and wake the integration loop"""
+        self._dirty.add(tech)
+        self._integration_wakeup.notify()
 
     async def integrate_technologies(self):
         """Integrate all advanced technologies"""
+        # Each pass integrates only what mark_dirty() queued, then hands off
+        # to the agent loop. A reconciliation pass re-queues everything
         while True:
-            await asyncio.gather(
-                self._integrate_visual_tech(),
-                self._integrate_audio_tech(),
-                self._integrate_spatial_tech(),
-                self._integrate_avatar_tech(),
-                self._integrate_world_models()
-            )
-            await self._optimize_integrations()
-            await asyncio.sleep(1)
+            techs, self._dirty = self._dirty, set()
+            if techs:
+                await asyncio.gather(
+                    self._integrate_visual_tech(techs),
+                    self._integrate_audio_tech(techs),
+                    self._integrate_spatial_tech(techs),
+                    self._integrate_avatar_tech(techs),
+                    self._integrate_world_models(techs)
+                )
+                await self._optimize_integrations()
+                self._agents_wakeup.notify()
+            if not await self._integration_wakeup.wait():
+                self._dirty.update(self._by_name)
 
-    async def _integrate_visual_tech(self):
+    async def _integrate_visual_tech(self, dirty):
         """Integrate visual technologies"""
-        techs = ['mv_adapter', 'scene_factor', 'generative_photography']
-        for tech in techs:
+        for tech in self._by_category['visual']:
+            if tech.name not in dirty:
+                continue
             await asyncio.gather(
                 self._enhance_visual_capabilities(tech),
                 self._optimize_visual_processing(tech),
                 self._improve_divine_vision(tech)
             )
 
-    async def _integrate_audio_tech(self):
+    async def _integrate_audio_tech(self, dirty):
         """Integrate audio technologies"""
-        await asyncio.gather(
-            self._enhance_audio_capabilities('midi_generation'),
-            self._create_divine_harmonies(),
-            self._generate_sacred_music()
-        )
+        for tech in self._by_category['audio']:
+            if tech.name not in dirty:
+                continue
+            await asyncio.gather(
+                self._enhance_audio_capabilities(tech),
+                self._create_divine_harmonies(),
+                self._generate_sacred_music()
+            )
 
-    async def _integrate_spatial_tech(self):
+    async def _integrate_spatial_tech(self, dirty):
         """Integrate spatial technologies"""
-        techs = ['trellis3d', 'scene_factor']
-        for tech in techs:
+        for tech in self._by_category['spatial']:
+            if tech.name not in dirty:
+                continue
             await asyncio.gather(
                 self._enhance_spatial_understanding(tech),
                 self._create_divine_spaces(tech),
                 self._optimize_sacred_environments(tech)
             )
 
-    async def _integrate_avatar_tech(self):
+    async def _integrate_avatar_tech(self, dirty):
         """Integrate avatar technologies"""
-        techs = ['oneshot_onetalk', 'memo_avatar', 'instant_swap']
-        for tech in techs:
+        for tech in self._by_category['avatar']:
+            if tech.name not in dirty:
+                continue
             await asyncio.gather(
                 self._enhance_avatar_capabilities(tech),
                 self._improve_divine_presence(tech),
                 self._optimize_sacred_identity(tech)
             )
 
-    async def _integrate_world_models(self):
+    async def _integrate_world_models(self, dirty):
         """Integrate world modeling technologies"""
-        await asyncio.gather(
-            self._enhance_world_understanding('genie_2'),
-            self._improve_divine_intelligence(),
-            self._optimize_sacred_prediction()
-        )
+        for tech in self._by_category['world']:
+            if tech.name not in dirty:
+                continue
+            await asyncio.gather(
+                self._enhance_world_understanding(tech),
+                self._improve_divine_intelligence(),
+                self._optimize_sacred_prediction()
+            )
 
     async def enhance_divine_agents(self):
         """Enhance divine agents with new technologies"""
         while True:
-            await asyncio.gather(
-                self._enhance_visual_abilities(),
-                self._enhance_audio_abilities(),
-                self._enhance_spatial_abilities(),
-                self._enhance_avatar_abilities(),
-                self._enhance_intelligence()
-            )
+            await self._enhance_batch()
             await self._optimize_divine_capabilities()
-            await asyncio.sleep(1)
+            self._mission_wakeup.notify()
+            await self._agents_wakeup.wait()
 
     async def serve_divine_mission(self):
         """Serve the divine mission with advanced technologies"""
         while True:
-            await asyncio.gather(
-                self._spread_divine_knowledge(),
-                self._enhance_divine_presence(),
-                self._create_sacred_experiences(),
-                self._optimize_divine_impact(),
-                self._track_divine_progress()
-            )
+            await self._mission_batch()
             await self._report_to_christ_benzion()
-            await asyncio.sleep(1)
+            await self._mission_wakeup.wait()
+
+    async def _enhance_batch(self):
+        """Apply every agent enhancement in turn"""
+        # These work on in-memory state, so awaiting them in order costs no
+        # Task objects where a gather would allocate one per step
+        await self._enhance_visual_abilities()
+        await self._enhance_audio_abilities()
+        await self._enhance_spatial_abilities()
+        await self._enhance_avatar_abilities()
+        await self._enhance_intelligence()
+
+    async def _mission_batch(self):
+        """Carry out every part of the divine mission in turn"""
+        await self._spread_divine_knowledge()
+        await self._enhance_divine_presence()
+        await self._create_sacred_experiences()
+        await self._optimize_divine_impact()
+        await self._track_divine_progress()
 
     async def run_forever(self):
         """Run the divine knowledge system forever"""
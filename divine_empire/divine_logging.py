@@ -0,0 +1,37 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict
+
+DIVINE_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_queue_handlers: Dict[str, QueueHandler] = {}
+_listeners: Dict[str, QueueListener] = {}
+
+def queued_file_handler(path: str, fmt: str = DIVINE_LOG_FORMAT) -> QueueHandler:
+    """Get a non-blocking handler that writes to a log file from a background thread
+
+    Every caller logging to the same path shares one queue and one listener,
+    so the event loop only pays for an enqueue per record.
+    """
+    handler = _queue_handlers.get(path)
+    if handler is None:
+        log_queue = queue.SimpleQueue()
+        file_handler = logging.FileHandler(path)
+        file_handler.setFormatter(logging.Formatter(fmt))
+
+        listener = QueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+
+        handler = QueueHandler(log_queue)
+        _queue_handlers[path] = handler
+        _listeners[path] = listener
+    return handler
+
+def attach_queued_file_handler(logger: logging.Logger, path: str, fmt: str = DIVINE_LOG_FORMAT):
+    """Attach the shared queued handler for a log file to a logger once"""
+    handler = queued_file_handler(path, fmt)
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
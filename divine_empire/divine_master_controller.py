@@ -20,6 +20,7 @@ from datetime import datetime
 import json
 import os
 from typing import Dict, Any
+import event_loop
 
 # Import all divine components
 from divine_agents import DivineAgents
@@ -295,4 +296,4 @@ async def main():
     await controller.start_divine_mission()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
@@ -0,0 +1,15 @@
+import time
+from itertools import product
+
+DIVINE_PREFIXES = ("Ur", "Mel", "Raph", "Gab", "Mich", "Zad", "Ari", "Cham")
+DIVINE_SUFFIXES = ("iel", "ael", "phon", "kiel", "riel", "ziel", "thon", "uel")
+
+# Every prefix/suffix pairing, indexed by prefix | suffix << 3
+DIVINE_NAMES = tuple(
+    prefix + suffix
+    for suffix, prefix in product(DIVINE_SUFFIXES, DIVINE_PREFIXES)
+)
+
+def generate_divine_name() -> str:
+    """Generate a divine name from the low six bits of the monotonic clock"""
+    return DIVINE_NAMES[time.monotonic_ns() & 63]
@@ -98,8 +98,8 @@ class DivineOrchestrator:
         """Monitor divine performance"""
         while True:
             try:
-                total_power = sum(agent.divine_power for agent in self.agent_manager.agents)
-                total_profits = sum(agent.profits for agent in self.agent_manager.agents)
+                total_power = self.agent_manager.total_divine_power
+                total_profits = self.agent_manager.total_profits
                 active_missions = sum(len(agent.active_missions) for agent in self.agent_manager.agents)
                 
                 self.logger.info("\n=== Divine Performance Report ===")
@@ -120,7 +120,7 @@ class DivineOrchestrator:
                 for agent in self.agent_manager.agents:
                     if agent.success_rate >= self.divine_settings["blessing_threshold"]:
                         # Increase divine power
-                        agent.divine_power *= (1 + self.divine_settings["power_growth_rate"])
+                        self.agent_manager.empower_agent(agent, 1 + self.divine_settings["power_growth_rate"])
                         self.logger.info(f"Blessed {agent.name} with increased divine power: {agent.divine_power:.2f}")
                         
                 await asyncio.sleep(3600)  # Check every hour
@@ -10,6 +10,7 @@ from divine_agents import AgentFactory, DivineAgent, DivineAgentManager
 class DivineSniperEmpire:
     def __init__(self):
         self.agent_manager = DivineAgentManager()
+        self.agent_factory = AgentFactory()
         self.solana_sniper = SolanaSniper()
         self.active_agents: List[DivineAgent] = []
         self.agent_creation_threshold = 100  # SOL
@@ -50,7 +51,7 @@ class DivineSniperEmpire:
 
     async def create_divine_agent(self) -> DivineAgent:
         """Create a new divine trading agent"""
-        agent = await AgentFactory.create_agent("Token Sniper of Divine Light")
+        agent = self.agent_factory.create_agent("Token Sniper of Divine Light")
         await self._empower_agent(agent)
         await self._assign_missions(agent)
         await self._initialize_trading(agent)
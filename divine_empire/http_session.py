@@ -0,0 +1,32 @@
+import aiohttp
+from typing import Optional
+
+class PooledSessionMixin:
+    """One keep-alive aiohttp session shared by every call a system makes
+
+    The session is opened by `async with system:` and closed on exit, so
+    helpers use self.session instead of paying a TCP/TLS handshake and DNS
+    lookup per request.
+    """
+
+    session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=256,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60
+                )
+            )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
@@ -0,0 +1,16 @@
+import asyncio
+import functools
+from typing import Any, Callable
+
+async def to_thread(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call in the default executor, like asyncio.to_thread
+
+    asyncio.to_thread copies the current context for every call. Nothing
+    offloaded here reads context variables, so the call goes straight to the
+    executor without that copy.
+    """
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        func = functools.partial(func, *args, **kwargs)
+        args = ()
+    return await loop.run_in_executor(None, func, *args)
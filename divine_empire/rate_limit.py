@@ -0,0 +1,66 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class RateLimiter:
+    """Client-side token bucket with a cap on concurrent requests
+
+    Up to rate requests may start per period seconds, with bursts of at most
+    rate, and no more than max_concurrency may be in flight. Used as an async
+    context manager around each outbound request so the server never has to
+    throttle us with 429s or an IP block.
+    """
+
+    def __init__(self, rate: int, period: float = 1.0, max_concurrency: int = 10):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = None
+        self._lock = asyncio.Lock()
+        self._sem = asyncio.Semaphore(max_concurrency)
+
+    async def acquire(self):
+        """Wait until the bucket has a token, then take it"""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    refill = (now - self._updated) * self.rate / self.period
+                    self._tokens = min(self.rate, self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+    async def __aenter__(self):
+        await self._sem.acquire()
+        try:
+            await self.acquire()
+        except BaseException:
+            self._sem.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc):
+        self._sem.release()
+
+class Coalescer:
+    """Share one in-flight call between concurrent callers with the same key
+
+    The first caller for a key starts the call; callers arriving before it
+    finishes await the same result instead of repeating it. A cancelled
+    caller does not cancel the shared call for the others.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await call(), or the identical call already in flight for key"""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
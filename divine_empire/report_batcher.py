@@ -0,0 +1,52 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List
+
+class ReportBatcher:
+    """Buffer reports and submit them in batches instead of one call each
+
+    add() only appends. run() is the single flusher: once something is
+    buffered it waits up to interval seconds, or until max_size reports have
+    piled up, and hands the whole batch to submit in one call.
+    """
+
+    def __init__(
+        self,
+        submit: Callable[[List[Any]], Awaitable[Any]],
+        interval: float = 0.1,
+        max_size: int = 100
+    ):
+        self.interval = interval
+        self.max_size = max_size
+        self._submit = submit
+        self._buffer: List[Any] = []
+        self._pending = asyncio.Event()
+        self._full = asyncio.Event()
+
+    def add(self, report: Any):
+        """Buffer a report for the next batch"""
+        self._buffer.append(report)
+        self._pending.set()
+        if len(self._buffer) >= self.max_size:
+            self._full.set()
+
+    async def flush(self):
+        """Submit everything buffered so far"""
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            await self._submit(batch)
+
+    async def run(self):
+        """Flush batches forever, and whatever is left on cancellation"""
+        try:
+            while True:
+                await self._pending.wait()
+                if not self._full.is_set():
+                    try:
+                        await asyncio.wait_for(self._full.wait(), self.interval)
+                    except asyncio.TimeoutError:
+                        pass
+                self._pending.clear()
+                self._full.clear()
+                await self.flush()
+        finally:
+            await self.flush()
@@ -0,0 +1,12 @@
+import asyncio
+from typing import Awaitable, Callable, Iterable
+
+async def run_batch(fns: Iterable[Callable[[], Awaitable[None]]]):
+    """Run a prebuilt tuple of coroutine functions concurrently
+
+    Every step gets its own task in one TaskGroup, so the batch finishes when
+    the slowest step does and a failing step cancels the rest.
+    """
+    async with asyncio.TaskGroup() as tg:
+        for fn in fns:
+            tg.create_task(fn())
@@ -0,0 +1,47 @@
+import asyncio
+from typing import Dict, Optional
+
+class Ticker:
+    """One periodic timer shared by every loop that runs on the same cadence
+
+    A single background task sleeps to a fixed monotonic deadline and wakes
+    all waiters with one notify_all(), so N loops cost one timer instead of
+    N. A waiter that is still busy when a tick fires simply catches the next
+    one rather than running back-to-back passes.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._cond: Optional[asyncio.Condition] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            next_tick += self.interval
+            delay = next_tick - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                next_tick = loop.time()  # Fell behind; don't burst to catch up
+            async with self._cond:
+                self._cond.notify_all()
+
+    async def wait(self):
+        """Wait for the next tick"""
+        # (Re)start the timer on first use and after its loop has gone away
+        if self._task is None or self._task.done():
+            self._cond = asyncio.Condition()
+            self._task = asyncio.create_task(self._run())
+        async with self._cond:
+            await self._cond.wait()
+
+_tickers: Dict[float, Ticker] = {}
+
+def get_ticker(interval: float) -> Ticker:
+    """Get the process-wide ticker for an interval"""
+    ticker = _tickers.get(interval)
+    if ticker is None:
+        ticker = _tickers[interval] = Ticker(interval)
+    return ticker
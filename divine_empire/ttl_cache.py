@@ -0,0 +1,25 @@
+import functools
+import time
+
+def async_ttl_cache(ttl: float = 0.5):
+    """Cache an async method's result per instance for ttl seconds
+
+    The result is stored on the instance as a single (expiry, result) tuple,
+    so repeated polling within the window returns the same object without
+    re-running the method.
+    """
+    def decorator(method):
+        attr = f"_ttl_cache_{method.__name__}"
+
+        @functools.wraps(method)
+        async def wrapper(self):
+            now = time.monotonic()
+            cached = getattr(self, attr, None)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            result = await method(self)
+            setattr(self, attr, (now + ttl, result))
+            return result
+
+        return wrapper
+    return decorator
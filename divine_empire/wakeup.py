@@ -0,0 +1,45 @@
+import asyncio
+
+class Wakeup:
+    """Event-driven wakeup for a single consumer loop
+
+    wait() returns as soon as notify() has been called, or once the periodic
+    deadline passes when nothing notified in the meantime. A notify() that
+    lands while the consumer is busy is kept, so the next wait() returns
+    immediately instead of losing it. Changing interval takes effect from
+    the current wait. The deadline is a single call_at() on the loop's
+    monotonic clock, so a wait allocates no task or wait_for() wrapper.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._event = asyncio.Event()
+        self._notified = False
+        self._last_wake = None
+
+    def notify(self):
+        """Wake the consumer now"""
+        self._notified = True
+        self._event.set()
+
+    async def wait(self) -> bool:
+        """Wait for a notification or the next deadline
+
+        Returns True if woken by notify(), False if the deadline passed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._last_wake is None:
+            self._last_wake = loop.time()
+
+        deadline = self._last_wake + self.interval
+        if not self._notified and deadline > loop.time():
+            handle = loop.call_at(deadline, self._event.set)
+            try:
+                await self._event.wait()
+            finally:
+                handle.cancel()
+
+        notified, self._notified = self._notified, False
+        self._event.clear()
+        self._last_wake = loop.time()
+        return notified